@@ -0,0 +1,172 @@
+import threading
+import time
+
+import numpy as np
+
+# Online feature-drift monitoring for the /predict stream. Each feature gets a
+# fixed-size histogram over bins cut at the baseline (training data) quantiles,
+# plus counts of non-finite (NaN/inf) values and min/max. Observing a request is a handful of vectorized
+# numpy ops; drift scores are only computed when a report is requested.
+
+DEFAULT_BINS = 10
+DEFAULT_THRESHOLD = 0.1
+# JS divergence of a sparse histogram is biased upward, so features are not
+# scored until they have this many observations
+DEFAULT_MIN_OBSERVATIONS = 100
+REPORT_QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+
+def jensen_shannon(p, q):
+    """Jensen-Shannon divergence (base 2, between 0 and 1) of two distributions."""
+    p = p / p.sum() if p.sum() else p
+    q = q / q.sum() if q.sum() else q
+    m = (p + q) / 2
+
+    def kl(a, b):
+        mask = a > 0
+        return float(np.sum(a[mask] * np.log2(a[mask] / b[mask])))
+
+    return (kl(p, m) + kl(q, m)) / 2
+
+
+class DriftMonitor:
+    """
+    Fixed-memory per-feature sketches of served inputs, compared with a baseline.
+    Args:
+        feature_names (list): Names of the input features, in request order.
+        baseline (numpy.ndarray): Baseline samples (n_samples, n_features).
+        bins (int): Equal-frequency bins per feature, cut at baseline quantiles.
+        threshold (float): Jensen-Shannon divergence above which a feature is flagged.
+        report_interval (float): Seconds a computed report is reused before recomputing.
+        min_observations (int): Finite values a feature needs before it is scored.
+    """
+
+    def __init__(self, feature_names, baseline, bins=DEFAULT_BINS, threshold=DEFAULT_THRESHOLD,
+                 report_interval=5.0, min_observations=DEFAULT_MIN_OBSERVATIONS):
+        if bins < 2:
+            raise ValueError("bins must be at least 2")
+        baseline = np.asarray(baseline, dtype=np.float64)
+        self.feature_names = list(feature_names)
+        self.threshold = threshold
+        self.report_interval = report_interval
+        self.min_observations = min_observations
+        n_features = len(self.feature_names)
+
+        # Inner edges only; bin 0 is below the first edge, bin `bins` is above the last
+        self.edges = np.quantile(baseline, np.linspace(0, 1, bins + 1)[1:-1], axis=0).T.copy()
+        self.baseline_counts = self._bin_counts(baseline)
+        self.baseline_min = np.nanmin(baseline, axis=0)
+        self.baseline_max = np.nanmax(baseline, axis=0)
+
+        # Offset of each feature's row in the flattened counts
+        self._offsets = np.arange(n_features) * bins
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget everything observed so far."""
+        n_features, n_edges = self.edges.shape
+        with self._lock:
+            self.counts = np.zeros((n_features, n_edges + 1), dtype=np.int64)
+            self._flat_counts = self.counts.reshape(-1)
+            self.nan_counts = np.zeros(n_features, dtype=np.int64)
+            self.min = np.full(n_features, np.inf)
+            self.max = np.full(n_features, -np.inf)
+            self.observations = 0
+            self._report = None
+            self._report_time = 0.0
+
+    def _bin_index(self, X):
+        # (n, n_features) -> bin per value, comparing against each feature's own edges
+        return (X[:, :, None] >= self.edges[None, :, :]).sum(axis=2)
+
+    def _bin_counts(self, X):
+        n_features, n_edges = self.edges.shape
+        X = X[~np.isnan(X).any(axis=1)]
+        flat = (self._bin_index(X) + np.arange(n_features) * (n_edges + 1)).ravel()
+        return np.bincount(flat, minlength=n_features * (n_edges + 1)).reshape(n_features, n_edges + 1)
+
+    def observe(self, features):
+        """
+        Record one request (a sequence of n_features values) or a batch (n, n_features).
+        """
+        X = np.asarray(features, dtype=np.float64)
+        if X.ndim == 1:
+            if np.isfinite(X).all():
+                # Hot path for a single request: every feature lands in its own cell
+                flat = (X[:, None] >= self.edges).sum(axis=1) + self._offsets
+                with self._lock:
+                    self.observations += 1
+                    self._flat_counts[flat] += 1
+                    np.minimum(self.min, X, out=self.min)
+                    np.maximum(self.max, X, out=self.max)
+                return
+            X = X[None, :]
+        self._observe_batch(X)
+
+    def _observe_batch(self, X):
+        # NaN and +/-inf are counted separately and kept out of the histogram and min/max
+        valid = np.isfinite(X)
+        flat = (self._bin_index(X) + self._offsets)[valid]
+        counts = np.bincount(flat, minlength=self._flat_counts.size)
+        with self._lock:
+            self.observations += len(X)
+            self._flat_counts += counts
+            self.nan_counts += (~valid).sum(axis=0)
+            np.minimum(self.min, np.where(valid, X, np.inf).min(axis=0), out=self.min)
+            np.maximum(self.max, np.where(valid, X, -np.inf).max(axis=0), out=self.max)
+
+    def _quantiles(self, i, counts, lo, hi, qs):
+        total = counts.sum()
+        if total == 0:
+            return [None] * len(qs)
+        # Interpolate within bins; the open outer bins end at the observed min/max
+        bounds = np.concatenate([[min(lo, self.edges[i, 0])], self.edges[i], [max(hi, self.edges[i, -1])]])
+        cumulative = np.concatenate([[0], np.cumsum(counts)]) / total
+        # Interpolating across a bin can land outside the observed range
+        return np.clip(np.interp(qs, cumulative, bounds), lo, hi).tolist()
+
+    def report(self, force=False):
+        """
+        Drift scores per feature, recomputed at most once per report_interval.
+        Returns:
+            dict: Observation count, per-feature stats and scores, and flagged features.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not force and self._report is not None and now - self._report_time < self.report_interval:
+                return self._report
+            counts = self.counts.copy()
+            nan_counts = self.nan_counts.copy()
+            mins = self.min.copy()
+            maxs = self.max.copy()
+            observations = self.observations
+
+        features = {}
+        for i, name in enumerate(self.feature_names):
+            seen = int(counts[i].sum())
+            score = None
+            if seen >= max(self.min_observations, 1):
+                score = jensen_shannon(counts[i].astype(float), self.baseline_counts[i].astype(float))
+            features[name] = {
+                "count": seen,
+                "nan_count": int(nan_counts[i]),
+                "min": float(mins[i]) if seen else None,
+                "max": float(maxs[i]) if seen else None,
+                "baseline_min": float(self.baseline_min[i]),
+                "baseline_max": float(self.baseline_max[i]),
+                "quantiles": dict(zip((str(q) for q in REPORT_QUANTILES),
+                                      self._quantiles(i, counts[i], mins[i], maxs[i], REPORT_QUANTILES))),
+                "js_divergence": score,
+                "drifted": score is not None and score > self.threshold,
+            }
+        report = {
+            "observations": observations,
+            "threshold": self.threshold,
+            "min_observations": self.min_observations,
+            "drifted_features": [name for name, f in features.items() if f["drifted"]],
+            "features": features,
+        }
+        with self._lock:
+            self._report, self._report_time = report, now
+        return report
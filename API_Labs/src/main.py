@@ -1,11 +1,33 @@
-from fastapi import FastAPI, status, HTTPException
-from pydantic import BaseModel
+import math
+
+from fastapi import FastAPI, Request, status, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
+import numpy as np
 from predict import predict_data
+from drift import DriftMonitor
+from model_store import BASELINE_PATH
 
 
 app = FastAPI()
 
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    # The default handler echoes rejected inputs, and JSON cannot encode inf/NaN
+    errors = [
+        {**error, "input": str(error["input"])}
+        if isinstance(error.get("input"), float) and not math.isfinite(error["input"]) else error
+        for error in exc.errors()
+    ]
+    return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        content={"detail": jsonable_encoder(errors)})
+
 class WineData(BaseModel):
+    # inf/NaN would reach the model and the drift report; JSON cannot encode them
+    model_config = ConfigDict(allow_inf_nan=False)
+
     alcohol: float
     malic_acid: float
     ash: float
@@ -23,6 +45,10 @@ class WineData(BaseModel):
 class WineResponse(BaseModel):
     response: int
 
+# Compare served inputs with the training data distribution. The baseline is
+# saved by train.py, so startup needs neither sklearn nor the dataset loader.
+drift_monitor = DriftMonitor(list(WineData.model_fields), np.load(BASELINE_PATH))
+
 @app.get("/", status_code=status.HTTP_200_OK)
 async def health_ping():
     return {"status": "healthy"}
@@ -46,11 +72,17 @@ async def predict_wine(wine_features: WineData):
             wine_features.proline
         ]]
         
+        drift_monitor.observe(features[0])
         prediction = predict_data(features)
         return WineResponse(response=int(prediction[0]))
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/drift")
+async def feature_drift():
+    """Per-feature drift scores of served inputs against the training data"""
+    return drift_monitor.report()
     
 
 
@@ -0,0 +1,161 @@
+import os
+import threading
+
+import numpy as np
+
+# Decision tree models stored as one flat .npy array of nodes. Opening the
+# artifact memory-maps it read-only, so every worker process serving the
+# model shares the same physical pages through the OS page cache instead of
+# holding its own unpickled copy.
+
+MODEL_PATH = "../model/wine_model.pkl"
+ARTIFACT_PATH = "../model/wine_model.npy"
+# Training features, the reference distribution for drift monitoring
+BASELINE_PATH = "../model/wine_baseline.npy"
+
+# One record per node; leaves have left == right == -1
+NODE_DTYPE = np.dtype([
+    ("left", "<i4"),
+    ("right", "<i4"),
+    ("feature", "<i4"),
+    ("threshold", "<f8"),
+    ("label", "<i8"),
+])
+
+
+def tree_nodes(estimator):
+    """
+    Convert a fitted sklearn DecisionTreeClassifier into a node array.
+    Args:
+        estimator: Fitted DecisionTreeClassifier with integer class labels.
+    Returns:
+        numpy.ndarray: Structured array of NODE_DTYPE records.
+    """
+    tree = estimator.tree_
+    nodes = np.empty(tree.node_count, dtype=NODE_DTYPE)
+    nodes["left"] = tree.children_left
+    nodes["right"] = tree.children_right
+    nodes["feature"] = np.where(tree.children_left >= 0, tree.feature, -1)
+    nodes["threshold"] = tree.threshold
+    # Majority class of each node, as predict() reports it for leaves
+    nodes["label"] = np.asarray(estimator.classes_)[tree.value[:, 0, :].argmax(axis=1)]
+    return nodes
+
+
+def save_tree(nodes, path=ARTIFACT_PATH):
+    """
+    Write a node array atomically, so processes that reopen `path` never see a partial file.
+    """
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, "wb") as f:
+        np.save(f, np.asarray(nodes, dtype=NODE_DTYPE))
+    os.replace(tmp, path)
+
+
+def export_pickle(model_path=MODEL_PATH, path=ARTIFACT_PATH):
+    """
+    Convert the pickled model written by train.py into a node array artifact.
+    """
+    # Only needed for exports; serving reads the artifact with numpy alone
+    import joblib
+
+    save_tree(tree_nodes(joblib.load(model_path)), path)
+
+
+class TreeModel:
+    """
+    Decision tree predictor over a node array.
+    Args:
+        nodes (numpy.ndarray): Structured array of NODE_DTYPE records (may be a memmap).
+    """
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        # Plain ndarray views into the (mapped) nodes, no copies
+        self.left = np.asarray(nodes["left"])
+        self.right = np.asarray(nodes["right"])
+        self.feature = np.asarray(nodes["feature"])
+        self.threshold = np.asarray(nodes["threshold"])
+        self.label = np.asarray(nodes["label"])
+        self.n_features = int(self.feature.max()) + 1 if len(nodes) else 0
+
+    @classmethod
+    def load(cls, path=ARTIFACT_PATH, mmap_mode="r"):
+        """Open an artifact; mmap_mode=None reads a private copy into memory."""
+        return cls(np.load(path, mmap_mode=mmap_mode))
+
+    def predict(self, X):
+        """
+        Predict the class labels for the input data.
+        Args:
+            X (numpy.ndarray): Input data of shape (n_samples, n_features).
+        Returns:
+            numpy.ndarray: Predicted class labels.
+        """
+        # sklearn compares float32 inputs against the float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] < self.n_features:
+            raise ValueError(f"Expected input of shape (n_samples, {self.n_features}), got {X.shape}")
+        if len(X) == 1:
+            return self.label[[self._leaf(X[0])]]
+
+        # Walk all rows down the tree together, one level per iteration
+        node = np.zeros(len(X), dtype=np.intp)
+        rows = np.arange(len(X))
+        active = self.left[node] >= 0
+        while active.any():
+            n, r = node[active], rows[active]
+            go_left = X[r, self.feature[n]] <= self.threshold[n]
+            node[active] = np.where(go_left, self.left[n], self.right[n])
+            active = self.left[node] >= 0
+        return self.label[node]
+
+    def _leaf(self, x):
+        # Scalar walk for single requests; cheaper than the vectorized path
+        node = 0
+        left, right, feature, threshold = self.left, self.right, self.feature, self.threshold
+        while left[node] >= 0:
+            node = left[node] if x[feature[node]] <= threshold[node] else right[node]
+        return node
+
+
+class SharedModel:
+    """
+    The served model, opened lazily and re-opened when a new generation is published.
+
+    serve.py sets `generation` to a counter in shared memory and bumps it after
+    replacing the artifact, so every worker switches to the new model on its
+    next request. Without a counter the artifact is opened once.
+
+    Args:
+        path (str): Node array artifact.
+        mmap_mode (str): np.load mmap mode; None keeps a private copy per process.
+    """
+
+    def __init__(self, path=ARTIFACT_PATH, mmap_mode="r"):
+        self.path = path
+        self.mmap_mode = mmap_mode
+        self.generation = None
+        self._loaded_generation = None
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _current_generation(self):
+        return self.generation.value if self.generation is not None else 0
+
+    def get(self):
+        """Return the current TreeModel, reloading it if a newer generation was published."""
+        model = self._model
+        if model is None or self._loaded_generation != self._current_generation():
+            model = self.reload()
+        return model
+
+    def reload(self):
+        with self._lock:
+            generation = self._current_generation()
+            self._model = TreeModel.load(self.path, self.mmap_mode)
+            self._loaded_generation = generation
+            return self._model
+
+    def predict(self, X):
+        return self.get().predict(X)
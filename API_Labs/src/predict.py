@@ -1,4 +1,7 @@
-import joblib
+from model_store import SharedModel
+
+# Memory-mapped from ../model/wine_model.npy; shared by all serve.py workers
+model = SharedModel()
 
 def predict_data(X):
     """
@@ -8,6 +11,5 @@ def predict_data(X):
     Returns:
         y_pred (numpy.ndarray): Predicted class labels.
     """
-    model = joblib.load("../model/wine_model.pkl")
     y_pred = model.predict(X)
     return y_pred
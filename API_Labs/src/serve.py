@@ -0,0 +1,168 @@
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+
+import uvicorn
+
+import model_store
+import predict
+
+# Multi-worker launcher for the wine API (Linux/macOS, uses fork).
+#
+# The parent imports the app and opens the model artifact once, binds the
+# listening socket, then forks the workers. The model is memory-mapped
+# read-only, so all workers share its pages. Sending SIGHUP to the parent
+# re-exports ../model/wine_model.pkl (e.g. after `python train.py`) and
+# publishes a new model generation; each worker re-opens the artifact on
+# its next request.
+
+# A worker that exits sooner than this after starting counts as a failed start;
+# restarts back off exponentially, and the launcher gives up after
+# MAX_FAILED_STARTS of them in a row (e.g. a bad option or a broken app).
+MIN_UPTIME = 5.0
+MAX_FAILED_STARTS = 5
+MAX_BACKOFF = 10.0
+
+
+def export_model(args):
+    model_store.export_pickle(args.model, args.artifact)
+    print(f"Exported {args.model} to {args.artifact}", flush=True)
+
+
+def run_worker(app_module, sock, args):
+    # uvicorn installs its own SIGINT/SIGTERM handlers for graceful shutdown
+    for sig in (signal.SIGHUP, signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, signal.SIG_DFL)
+    if args.private_model:
+        predict.model.mmap_mode = None
+        predict.model.reload()
+    config = uvicorn.Config(app_module.app, log_level=args.log_level)
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+    # uvicorn returns without raising when startup fails
+    return server.started
+
+
+def spawn(app_module, sock, args):
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            code = 0 if run_worker(app_module, sock, args) else 3
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+    return pid
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the wine API from several worker processes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--model", default=model_store.MODEL_PATH, help="pickled model written by train.py")
+    parser.add_argument("--artifact", default=model_store.ARTIFACT_PATH, help="node array artifact to serve")
+    parser.add_argument("--export", action="store_true", help="re-export the artifact from --model before starting")
+    parser.add_argument("--private-model", action="store_true",
+                        help="load a private copy of the model in every worker instead of sharing it (for comparison)")
+    parser.add_argument("--log-level", default="info")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.export or not os.path.exists(args.artifact):
+        export_model(args)
+
+    # Preload in the parent: workers inherit the imported app and the open model
+    import main as app_module
+
+    generation = multiprocessing.RawValue("q", 0)
+    predict.model.path = args.artifact
+    predict.model.generation = generation
+    predict.model.get()
+
+    sock = socket.socket(socket.AF_INET6 if ":" in args.host else socket.AF_INET)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((args.host, args.port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    pending = []
+    signal.signal(signal.SIGHUP, lambda *_: pending.append("reload"))
+    signal.signal(signal.SIGINT, lambda *_: pending.append("stop"))
+    signal.signal(signal.SIGTERM, lambda *_: pending.append("stop"))
+
+    # pid -> start time
+    workers = {spawn(app_module, sock, args): time.monotonic() for _ in range(args.workers)}
+    print(f"Serving on http://{args.host}:{args.port} with {len(workers)} workers "
+          f"(parent pid {os.getpid()})", flush=True)
+
+    failed_starts = 0
+    restart_at = []
+    exit_code = 0
+    while "stop" not in pending:
+        if "reload" in pending:
+            pending.remove("reload")
+            try:
+                export_model(args)
+                generation.value += 1
+                print(f"Published model generation {generation.value}", flush=True)
+            except Exception as e:
+                print(f"Reload failed, keeping the current model: {e}", file=sys.stderr, flush=True)
+
+        now = time.monotonic()
+        for pid, started in list(workers.items()):
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if not done:
+                continue
+            del workers[pid]
+            code = os.waitstatus_to_exitcode(status)
+            if now - started < MIN_UPTIME:
+                failed_starts += 1
+            else:
+                failed_starts = 0
+            if failed_starts >= MAX_FAILED_STARTS:
+                print(f"Workers failed {failed_starts} times in a row right after starting "
+                      f"(last exit code {code}); stopping", file=sys.stderr, flush=True)
+                pending.append("stop")
+                exit_code = 1
+                break
+            delay = min(0.5 * 2 ** failed_starts, MAX_BACKOFF) if failed_starts else 0.0
+            print(f"Worker {pid} exited with code {code}; restarting in {delay:.1f}s",
+                  file=sys.stderr, flush=True)
+            restart_at.append(now + delay)
+
+        # Replace workers that died, once their backoff has passed
+        if "stop" not in pending:
+            for due in [t for t in restart_at if t <= now]:
+                restart_at.remove(due)
+                workers[spawn(app_module, sock, args)] = time.monotonic()
+        time.sleep(0.2)
+
+    for pid in workers:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for pid in workers:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+    sock.close()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
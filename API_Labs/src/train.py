@@ -1,6 +1,8 @@
 from sklearn.tree import DecisionTreeClassifier
 import joblib
 from data import load_data, split_data
+from model_store import BASELINE_PATH, export_pickle
+import numpy as np
 
 def fit_model(X_train, y_train):
     """
@@ -12,8 +14,11 @@ def fit_model(X_train, y_train):
     dt_classifier = DecisionTreeClassifier(max_depth=3, random_state=12)
     dt_classifier.fit(X_train, y_train)
     joblib.dump(dt_classifier, "../model/wine_model.pkl")
+    # Node array artifact that the API memory-maps for serving
+    export_pickle("../model/wine_model.pkl", "../model/wine_model.npy")
 
 if __name__ == "__main__":
     X, y = load_data()
+    np.save(BASELINE_PATH, X)
     X_train, X_test, y_train, y_test = split_data(X, y)
     fit_model(X_train, y_train)
@@ -0,0 +1,50 @@
+import json
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # main.py opens the model and baseline relative to src/
+    monkeypatch.chdir(SRC_DIR)
+    import main
+
+    main.drift_monitor.reset()
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def wine():
+    return {
+        "alcohol": 13.2, "malic_acid": 2.3, "ash": 2.4, "alcalinity_of_ash": 19.5,
+        "magnesium": 100.0, "total_phenols": 2.3, "flavanoids": 2.0,
+        "nonflavanoid_phenols": 0.36, "proanthocyanins": 1.6, "color_intensity": 5.1,
+        "hue": 0.96, "od280_od315_of_diluted_wines": 2.6, "proline": 750.0,
+    }
+
+
+def test_predict(client, wine):
+    """Test a valid request is classified and counted by the drift monitor"""
+    response = client.post("/predict", json=wine)
+    assert response.status_code == 200
+    assert response.json()["response"] in (0, 1, 2)
+    assert client.get("/drift").json()["observations"] == 1
+
+
+@pytest.mark.parametrize("value", ["Infinity", "-Infinity", "NaN"])
+def test_predict_rejects_non_finite_values(client, wine, value):
+    """Test inf/NaN inputs get a 422 and never reach the drift report"""
+    body = json.dumps(wine).replace("13.2", value)
+    response = client.post("/predict", content=body, headers={"Content-Type": "application/json"})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "alcohol"]
+
+    drift = client.get("/drift")
+    assert drift.status_code == 200
+    assert drift.json()["observations"] == 0
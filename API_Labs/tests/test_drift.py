@@ -0,0 +1,146 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from drift import DriftMonitor, jensen_shannon
+
+FEATURES = ["alcohol", "malic_acid", "proline"]
+
+
+@pytest.fixture
+def baseline():
+    rng = np.random.default_rng(0)
+    return np.column_stack([
+        rng.normal(13, 0.8, 2000),
+        rng.exponential(2.3, 2000),
+        rng.normal(750, 300, 2000),
+    ])
+
+
+@pytest.fixture
+def monitor(baseline):
+    return DriftMonitor(FEATURES, baseline, bins=10, threshold=0.1, report_interval=0)
+
+
+def test_no_drift_on_baseline_distribution(monitor, baseline):
+    """Test requests drawn like the baseline are not flagged"""
+    rng = np.random.default_rng(1)
+    for row in baseline[rng.choice(len(baseline), 500)]:
+        monitor.observe(list(row))
+
+    report = monitor.report()
+    assert report["observations"] == 500
+    assert report["drifted_features"] == []
+    assert all(f["js_divergence"] < 0.05 for f in report["features"].values())
+
+
+def test_few_baseline_requests_are_not_flagged():
+    """Test low traffic drawn from the training data is not reported as drift"""
+    baseline = np.load(os.path.join(os.path.dirname(__file__), "..", "model", "wine_baseline.npy"))
+    names = [f"f{i}" for i in range(baseline.shape[1])]
+    monitor = DriftMonitor(names, baseline, report_interval=0)
+    rng = np.random.default_rng(2)
+    for n in (1, 10, 99):
+        while monitor.observations < n:
+            monitor.observe(list(baseline[rng.integers(len(baseline))]))
+        report = monitor.report()
+        assert report["drifted_features"] == []
+        assert report["min_observations"] == 100
+        assert all(f["count"] == n and f["js_divergence"] is None for f in report["features"].values())
+
+    monitor.observe(baseline[rng.integers(len(baseline))])
+    assert all(f["js_divergence"] is not None for f in monitor.report()["features"].values())
+
+
+def test_flags_shifted_feature(monitor, baseline):
+    """Test a shifted feature is flagged and the others are not"""
+    shifted = baseline[:500].copy()
+    shifted[:, 2] += 600
+    monitor.observe(shifted)
+
+    report = monitor.report()
+    assert report["drifted_features"] == ["proline"]
+    assert report["features"]["proline"]["min"] == pytest.approx(shifted[:, 2].min())
+    assert report["features"]["proline"]["quantiles"]["0.5"] > np.median(baseline[:, 2])
+
+
+def test_single_and_batch_observations_agree(baseline):
+    """Test the single-request hot path counts like the batch path"""
+    single = DriftMonitor(FEATURES, baseline, report_interval=0)
+    batch = DriftMonitor(FEATURES, baseline, report_interval=0)
+    for row in baseline[:300]:
+        single.observe(list(row))
+    batch.observe(baseline[:300])
+
+    np.testing.assert_array_equal(single.counts, batch.counts)
+    np.testing.assert_array_equal(single.min, batch.min)
+    np.testing.assert_array_equal(single.max, batch.max)
+    assert single.report() == batch.report()
+
+
+def test_nan_values_counted_separately(monitor):
+    """Test NaNs are counted but kept out of histograms and min/max"""
+    monitor.observe([13.0, float("nan"), 800.0])
+    monitor.observe(np.array([[12.0, 1.0, float("nan")], [14.0, 2.0, 900.0]]))
+
+    features = monitor.report()["features"]
+    assert features["malic_acid"]["nan_count"] == 1
+    assert features["malic_acid"]["count"] == 2
+    assert features["malic_acid"]["min"] == 1.0
+    assert features["proline"]["nan_count"] == 1
+    assert features["proline"]["max"] == 900.0
+    assert features["alcohol"]["count"] == 3
+
+
+def test_infinite_values_counted_with_nans(monitor):
+    """Test +/-inf go to nan_count and leave min/max and the report JSON-safe"""
+    monitor.observe([13.0, float("inf"), 800.0])
+    monitor.observe(np.array([[12.0, 1.0, -np.inf], [14.0, 2.0, 900.0]]))
+
+    features = monitor.report()["features"]
+    assert features["malic_acid"]["nan_count"] == 1
+    assert features["malic_acid"]["max"] == 2.0
+    assert features["proline"]["nan_count"] == 1
+    assert features["proline"]["min"] == 800.0
+    for stats in features.values():
+        assert all(np.isfinite(q) for q in stats["quantiles"].values())
+
+
+def test_quantiles_stay_within_observed_range(monitor):
+    """Test interpolated quantiles never fall outside the observed min/max"""
+    monitor.observe([13.2, 2.0, 750.0])
+
+    for stats in monitor.report()["features"].values():
+        assert set(stats["quantiles"].values()) == {stats["min"]}
+
+
+def test_fixed_memory_and_reset(monitor, baseline):
+    """Test state size does not grow with observations and reset clears it"""
+    shape = monitor.counts.shape
+    monitor.observe(baseline)
+    assert monitor.counts.shape == shape
+    assert monitor.counts.sum() == baseline.size
+
+    monitor.reset()
+    report = monitor.report()
+    assert report["observations"] == 0
+    assert report["features"]["alcohol"]["js_divergence"] is None
+
+
+def test_report_is_cached_between_intervals(baseline):
+    """Test reports are reused until report_interval passes"""
+    monitor = DriftMonitor(FEATURES, baseline, report_interval=60)
+    first = monitor.report()
+    monitor.observe(baseline[0])
+    assert monitor.report() is first
+    assert monitor.report(force=True)["observations"] == 1
+
+
+def test_jensen_shannon_bounds():
+    """Test divergence is 0 for equal and 1 for disjoint distributions"""
+    assert jensen_shannon(np.array([1.0, 2.0, 3.0]), np.array([2.0, 4.0, 6.0])) == pytest.approx(0.0)
+    assert jensen_shannon(np.array([1.0, 0.0]), np.array([0.0, 1.0])) == pytest.approx(1.0)
@@ -0,0 +1,75 @@
+import multiprocessing
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from model_store import NODE_DTYPE, SharedModel, TreeModel, save_tree
+
+MODEL_DIR = os.path.join(os.path.dirname(__file__), "..", "model")
+
+
+def make_tree(low_label=0, high_label=1):
+    """x0 <= 0.5 -> low_label, else x1 <= 2.0 -> 2, else high_label"""
+    nodes = np.zeros(5, dtype=NODE_DTYPE)
+    nodes[0] = (1, 2, 0, 0.5, 0)
+    nodes[1] = (-1, -1, -1, -2.0, low_label)
+    nodes[2] = (3, 4, 1, 2.0, 2)
+    nodes[3] = (-1, -1, -1, -2.0, 2)
+    nodes[4] = (-1, -1, -1, -2.0, high_label)
+    return nodes
+
+
+def test_predict_single_and_batch():
+    """Test the single-row walk and the batched walk give the same labels"""
+    model = TreeModel(make_tree())
+    X = np.array([[0.0, 0.0], [0.5, 9.0], [1.0, 2.0], [1.0, 3.0]])
+    np.testing.assert_array_equal(model.predict(X), [0, 0, 2, 1])
+    assert [model.predict(X[i:i + 1])[0] for i in range(len(X))] == [0, 0, 2, 1]
+
+
+def test_predict_rejects_too_few_features():
+    """Test inputs missing features the tree splits on are rejected"""
+    with pytest.raises(ValueError):
+        TreeModel(make_tree()).predict([[1.0]])
+
+
+def test_load_is_read_only_memmap(tmp_path):
+    """Test the artifact is mapped read-only rather than copied"""
+    path = str(tmp_path / "model.npy")
+    save_tree(make_tree(), path)
+    model = TreeModel.load(path)
+    assert isinstance(model.nodes, np.memmap)
+    assert not model.threshold.flags.writeable
+    assert os.listdir(tmp_path) == ["model.npy"]
+
+
+def test_shared_model_reloads_on_new_generation(tmp_path):
+    """Test workers pick up a replaced artifact once the generation is bumped"""
+    path = str(tmp_path / "model.npy")
+    save_tree(make_tree(high_label=1), path)
+    model = SharedModel(path)
+    model.generation = multiprocessing.RawValue("q", 0)
+    X = [[1.0, 3.0]]
+    assert model.predict(X)[0] == 1
+
+    save_tree(make_tree(high_label=7), path)
+    # Not published yet: keep serving the mapped model
+    assert model.predict(X)[0] == 1
+    model.generation.value += 1
+    assert model.predict(X)[0] == 7
+
+
+def test_artifact_matches_pickled_model():
+    """Test the committed artifact predicts like the sklearn model it was exported from"""
+    joblib = pytest.importorskip("joblib")
+    pytest.importorskip("sklearn")
+    from sklearn.datasets import load_wine
+
+    X = load_wine().data
+    sklearn_model = joblib.load(os.path.join(MODEL_DIR, "wine_model.pkl"))
+    model = TreeModel.load(os.path.join(MODEL_DIR, "wine_model.npy"))
+    np.testing.assert_array_equal(model.predict(X), sklearn_model.predict(X))
@@ -0,0 +1,16 @@
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+
+def test_app_starts_without_heavy_dependencies():
+    """Test importing the app and opening the model loads neither sklearn, joblib nor pandas"""
+    code = (
+        "import sys, main, predict; predict.model.get(); "
+        "print(','.join(m for m in ('sklearn', 'joblib', 'pandas', 'scipy') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
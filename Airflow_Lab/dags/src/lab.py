@@ -1,17 +1,18 @@
-import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.cluster import KMeans
-from kneed import KneeLocator
 import pickle
 import os
 import base64
 
+# pandas, sklearn and kneed are imported inside the task functions. The scheduler
+# imports this module every time it parses airflow.py, but only task runs need them.
+
 def load_data():
     """
     Loads data from a CSV file, serializes it, and returns the serialized data.
     Returns:
         str: Base64-encoded serialized data (JSON-safe).
     """
+    import pandas as pd
+
     print("Loading data from file.csv")
     df = pd.read_csv(os.path.join(os.path.dirname(__file__), "../data/file.csv"))
     print(f"Loaded {len(df)} rows from file.csv")
@@ -23,6 +24,8 @@ def data_preprocessing(data_b64: str):
     Deserializes base64-encoded pickled data, performs preprocessing,
     and returns base64-encoded pickled clustered data AND the scaler.
     """
+    from sklearn.preprocessing import MinMaxScaler
+
     print("Preprocessing data...")
     data_bytes = base64.b64decode(data_b64)
     df = pickle.loads(data_bytes)
@@ -53,6 +56,8 @@ def build_save_model(data_b64: str, filename: str):
     Builds a KMeans model on the preprocessed data and saves it along with the scaler.
     Returns the SSE list (JSON-serializable).
     """
+    from sklearn.cluster import KMeans
+
     print("Building and saving model...")
     data_bytes = base64.b64decode(data_b64)
     result = pickle.loads(data_bytes)
@@ -93,6 +98,9 @@ def load_model_elbow(filename: str, sse: list):
     Loads the saved model and scaler, uses the elbow method to report k.
     Returns the optimal number of clusters.
     """
+    import pandas as pd
+    from kneed import KneeLocator
+
     print("Loading model and determining optimal clusters...")
     
     # Load the saved model
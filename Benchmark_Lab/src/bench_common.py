@@ -0,0 +1,64 @@
+import contextlib
+import logging
+import os
+
+# Constants and fixtures shared by the benchmarks. Kept free of httpx and the
+# load-test harness so that importing it has no side effects.
+
+# Repository root (Benchmark_Lab/src/bench_common.py -> repo root)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WINE_SAMPLE = {
+    "alcohol": 13.2,
+    "malic_acid": 1.78,
+    "ash": 2.14,
+    "alcalinity_of_ash": 11.2,
+    "magnesium": 100.0,
+    "total_phenols": 2.65,
+    "flavanoids": 2.76,
+    "nonflavanoid_phenols": 0.26,
+    "proanthocyanins": 1.28,
+    "color_intensity": 4.38,
+    "hue": 1.05,
+    "od280_od315_of_diluted_wines": 3.4,
+    "proline": 1050.0,
+}
+
+
+def item_payload(n):
+    return {"name": f"Item {n}", "description": f"Benchmark item {n}"}
+
+
+def percentile(sorted_values, pct):
+    """
+    Nearest-rank percentile of an already sorted list.
+    Args:
+        sorted_values (list): Values sorted in ascending order.
+        pct (float): Percentile between 0 and 100.
+    Returns:
+        float: The percentile value (0.0 for an empty list).
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@contextlib.contextmanager
+def log_files_in(log_dir):
+    """
+    Open the log files that code run inside this block creates (Logging_Lab's
+    books_api.log) in log_dir instead of next to the app, so benchmark runs
+    never write to the tracked tree.
+    """
+    file_handler = logging.FileHandler
+
+    class TempDirFileHandler(file_handler):
+        def __init__(self, filename, *args, **kwargs):
+            super().__init__(os.path.join(log_dir, os.path.basename(filename)), *args, **kwargs)
+
+    logging.FileHandler = TempDirFileHandler
+    try:
+        yield
+    finally:
+        logging.FileHandler = file_handler
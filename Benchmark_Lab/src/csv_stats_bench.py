@@ -0,0 +1,109 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from bench_common import REPO_ROOT
+
+# CSV profiling: pd.read_csv + describe() on the whole file against the chunked
+# multi-core engine in TFDV_Lab/csv_stats.py, on a synthetic Jena-like CSV.
+# Each variant runs in a fresh interpreter so its peak RSS can be compared.
+
+JENA_COLUMNS = [
+    "p (mbar)", "T (degC)", "Tpot (K)", "Tdew (degC)", "rh (%)", "VPmax (mbar)",
+    "VPact (mbar)", "VPdef (mbar)", "sh (g/kg)", "H2OC (mmol/mol)", "rho (g/m**3)",
+    "wv (m/s)", "max. wv (m/s)", "wd (deg)",
+]
+
+PANDAS_SCRIPT = """
+import sys, pandas as pd
+df = pd.read_csv(sys.argv[1], header=0, index_col=0)
+df.describe()
+"""
+
+ENGINE_SCRIPT = """
+import sys
+sys.path.insert(0, sys.argv[2])
+from csv_stats import profile_csv
+profile_csv(sys.argv[1], workers=int(sys.argv[3]), chunk_bytes=int(sys.argv[4]))
+"""
+
+# Peak RSS of the child and, for the engine, of its largest worker (in KB)
+RUSAGE_WRAPPER = """
+import resource, sys
+code = sys.argv.pop(1)
+exec(compile(code, "<bench>", "exec"))
+me = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+try:
+    # ru_maxrss survives exec on Linux; VmHWM only covers this process image
+    with open("/proc/self/status") as f:
+        me = next(int(line.split()[1]) for line in f if line.startswith("VmHWM"))
+except OSError:
+    pass
+kids = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+print(me, kids)
+"""
+
+
+def write_csv(path, rows, seed=42):
+    rng = np.random.default_rng(seed)
+    # Small blocks keep this process small; forked children inherit its peak RSS
+    block = 50_000
+    with open(path, "w") as f:
+        f.write(",".join(["Date Time", *JENA_COLUMNS]) + "\n")
+    start = pd.Timestamp("2009-01-01")
+    for offset in range(0, rows, block):
+        n = min(block, rows - offset)
+        times = (start + pd.to_timedelta(np.arange(offset, offset + n) * 10, unit="min")).strftime("%d.%m.%Y %H:%M:%S")
+        df = pd.DataFrame(rng.normal(10, 5, (n, len(JENA_COLUMNS))).round(2), columns=JENA_COLUMNS)
+        df.insert(0, "Date Time", times)
+        df.to_csv(path, mode="a", header=False, index=False)
+
+
+def run(code, *args):
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", RUSAGE_WRAPPER, code, *args],
+                         check=True, capture_output=True, text=True).stdout
+    elapsed = time.perf_counter() - start
+    me, kids = (int(x) for x in out.split()[-2:])
+    # ru_maxrss is in bytes on macOS
+    if sys.platform == "darwin":
+        me, kids = me / 1024, kids / 1024
+    return elapsed, me / 1024, kids / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark chunked CSV profiling")
+    parser.add_argument("--rows", type=int, default=420_551 * 5, help="default: 5x the Jena dataset")
+    parser.add_argument("--workers", default=f"1,2,{os.cpu_count()}")
+    parser.add_argument("--chunk-mb", type=float, default=16)
+    parser.add_argument("--csv", help="profile this CSV instead of generating one")
+    args = parser.parse_args(argv)
+
+    tfdv_dir = os.path.join(REPO_ROOT, "TFDV_Lab")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.csv
+        if path is None:
+            path = os.path.join(tmp, "jena_synthetic.csv")
+            print(f"Writing {args.rows:,} rows to {path}...")
+            write_csv(path, args.rows)
+        print(f"CSV size: {os.path.getsize(path) / 1024**2:.0f} MB\n")
+
+        print(f"{'variant':28s} {'seconds':>9s} {'main MB':>9s} {'worker MB':>10s}")
+        elapsed, me, _ = run(PANDAS_SCRIPT, path)
+        print(f"{'read_csv + describe':28s} {elapsed:>9.2f} {me:>9.0f} {'-':>10s}")
+        chunk_bytes = str(int(args.chunk_mb * 1024 * 1024))
+        for workers in sorted({int(w) for w in args.workers.split(",")}):
+            elapsed, me, kids = run(ENGINE_SCRIPT, path, tfdv_dir, str(workers), chunk_bytes)
+            worker_mb = f"{kids:.0f}" if workers > 1 else "-"
+            print(f"{f'profile_csv workers={workers}':28s} {elapsed:>9.2f} {me:>9.0f} {worker_mb:>10s}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
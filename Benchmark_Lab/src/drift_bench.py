@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from bench_common import REPO_ROOT, WINE_SAMPLE
+
+sys.path.insert(0, os.path.join(REPO_ROOT, "API_Labs", "src"))
+
+from drift import DriftMonitor  # noqa: E402
+
+# Hot-path cost of the /predict drift monitor in API_Labs/src/drift.py: one
+# observe() per request, batched observes, and building a drift report.
+
+
+def per_call_us(fn, args_list):
+    start = time.perf_counter()
+    for args in args_list:
+        fn(args)
+    return (time.perf_counter() - start) / len(args_list) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the /predict drift monitor")
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--bins", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(42)
+    names = list(WINE_SAMPLE)
+    sample = np.array(list(WINE_SAMPLE.values()))
+    baseline = sample * rng.normal(1, 0.1, (178, len(sample)))
+    monitor = DriftMonitor(names, baseline, bins=args.bins, report_interval=0)
+
+    rows = (sample * rng.normal(1, 0.1, (args.requests, len(sample)))).tolist()
+    single = per_call_us(monitor.observe, rows)
+    batches = [np.array(rows[i:i + args.batch]) for i in range(0, len(rows), args.batch)]
+    batch = per_call_us(monitor.observe, batches)
+    report_ms = per_call_us(lambda _: monitor.report(force=True), range(200)) / 1000
+
+    print(f"observe(1 request):        {single:8.2f} us")
+    print(f"observe({args.batch} requests):      {batch:8.2f} us ({batch / args.batch:.2f} us per request)")
+    print(f"report():                  {report_ms:8.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
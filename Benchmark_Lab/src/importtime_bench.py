@@ -0,0 +1,177 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from bench_common import REPO_ROOT
+
+# Cold-start cost of the entry points, from `python -X importtime` plus the
+# wall time of a fresh interpreter running each target. The -pickle and
+# -eager targets reproduce the old startup paths for comparison.
+
+HEAVY_PACKAGES = ["sklearn", "scipy", "pandas", "joblib", "kneed", "airflow"]
+
+API_SRC = os.path.join(REPO_ROOT, "API_Labs", "src")
+DAGS_DIR = os.path.join(REPO_ROOT, "Airflow_Lab", "dags")
+
+TARGETS = {
+    "python": {
+        "cwd": REPO_ROOT,
+        "code": "pass",
+        "about": "bare interpreter start, for reference",
+    },
+    "api": {
+        "cwd": API_SRC,
+        "code": "import main; import predict; predict.model.get()",
+        "about": "API_Labs app import with the array model opened",
+    },
+    "api-pickle": {
+        "cwd": API_SRC,
+        "code": "import main; import joblib; joblib.load('../model/wine_model.pkl')",
+        "about": "API_Labs app import plus unpickling the sklearn model",
+    },
+    "airflow-lab": {
+        "cwd": DAGS_DIR,
+        "code": "import src.lab",
+        "about": "Airflow_Lab task module, as imported when parsing the DAG",
+    },
+    "airflow-lab-eager": {
+        "cwd": DAGS_DIR,
+        "code": "import src.lab; import pandas, sklearn.preprocessing, sklearn.cluster, kneed",
+        "about": "the task module with its heavy imports at module level",
+    },
+    "airflow-dag": {
+        "cwd": DAGS_DIR,
+        # The DAG file is named airflow.py, so import the real package before dags/ is on the path
+        "code": ("import sys; sys.path.remove(''); import airflow; sys.path.insert(0, ''); "
+                 "import runpy; runpy.run_path('airflow.py', run_name='dag_parse')"),
+        "about": "parsing the DAG file (needs apache-airflow)",
+    },
+}
+
+
+def parse_importtime(stderr):
+    """
+    Summarize `-X importtime` output.
+    Returns:
+        dict: Total import time in ms, module count, and self time in ms per top-level package.
+    """
+    packages = {}
+    total_us = 0
+    modules = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        self_us = int(self_us)
+        top = name.strip().split(".")[0]
+        packages[top] = packages.get(top, 0) + self_us
+        total_us += self_us
+        modules += 1
+    return {
+        "import_ms": total_us / 1000,
+        "modules": modules,
+        "packages_ms": {k: v / 1000 for k, v in sorted(packages.items(), key=lambda kv: -kv[1])},
+    }
+
+
+def run_target(name, repeat):
+    spec = TARGETS[name]
+    cmd = [sys.executable, "-W", "ignore", "-c", spec["code"]]
+    profile = subprocess.run([sys.executable, "-X", "importtime", *cmd[1:]],
+                             cwd=spec["cwd"], capture_output=True, text=True)
+    if profile.returncode != 0:
+        return {"skipped": profile.stderr.strip().splitlines()[-1]}
+
+    result = parse_importtime(profile.stderr)
+    walls = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=spec["cwd"], check=True, capture_output=True)
+        walls.append((time.perf_counter() - start) * 1000)
+    result["wall_ms"] = statistics.median(walls)
+    result["heavy"] = [p for p in HEAVY_PACKAGES if p in result["packages_ms"]]
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Regression messages for targets whose median wall time grew beyond the threshold."""
+    regressions = []
+    for name, base in baseline.get("results", {}).items():
+        current = results.get(name)
+        if not current or "wall_ms" not in current or "wall_ms" not in base:
+            continue
+        if current["wall_ms"] > base["wall_ms"] * (1 + threshold):
+            regressions.append(f"{name}: wall {current['wall_ms']:.0f}ms > baseline {base['wall_ms']:.0f}ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile entry point import time with -X importtime")
+    parser.add_argument("--targets", default=",".join(TARGETS), help="comma separated: " + ", ".join(TARGETS))
+    parser.add_argument("--repeat", type=int, default=5, help="cold starts per target for the median wall time")
+    parser.add_argument("--top", type=int, default=5, help="slowest packages to list per target")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="fail if wall times regress against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed relative regression before failing (default 0.2)")
+    args = parser.parse_args(argv)
+
+    names = args.targets.split(",")
+    unknown = [n for n in names if n not in TARGETS]
+    if unknown:
+        print(f"Unknown targets: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    results = {}
+    header = f"{'target':20s} {'wall ms':>9s} {'import ms':>10s} {'modules':>8s}  heavy packages"
+    print(header)
+    print("-" * len(header))
+    for name in names:
+        r = results[name] = run_target(name, args.repeat)
+        if "skipped" in r:
+            print(f"{name:20s} skipped: {r['skipped']}")
+            continue
+        print(f"{name:20s} {r['wall_ms']:>9.0f} {r['import_ms']:>10.0f} {r['modules']:>8d}  "
+              f"{', '.join(r['heavy']) or '-'}")
+
+    print("\nSlowest packages (self import ms):")
+    for name, r in results.items():
+        if "skipped" not in r:
+            top = list(r["packages_ms"].items())[:args.top]
+            print(f"  {name:20s} " + ", ".join(f"{p} {ms:.0f}" for p, ms in top))
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        report = {
+            "meta": {
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "repeat": args.repeat,
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%} of {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,496 @@
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from bench_common import REPO_ROOT, WINE_SAMPLE, item_payload, log_files_in, percentile
+
+# Apps that configure the root logger (Logging_Lab) would otherwise log every harness request
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("httpcore").setLevel(logging.WARNING)
+
+# Share of read requests that fetch the whole collection instead of a single record
+LIST_READ_SHARE = 0.5
+
+# Read ratio for each collection workload (the rest are writes)
+WORKLOADS = {
+    "read-heavy": 0.9,
+    "mixed": 0.5,
+    "write-heavy": 0.1,
+}
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+def coffee_shop_payload(n):
+    return {
+        "id": str(n),
+        "name": f"Coffee Shop {n}",
+        "neighborhood": "Back Bay",
+        "specialty": "Espresso",
+        "rating": 4.5,
+    }
+
+
+def book_payload(n):
+    return {
+        "id": str(n),
+        "title": f"Book {n}",
+        "author": "Benchmark Author",
+        "price": 12.99,
+        "pages": 300,
+    }
+
+
+def _strip_id(payload):
+    return {k: v for k, v in payload.items() if k != "id"}
+
+
+# Services under test. Collection services get the read/write workloads,
+# the wine model only gets the predict workload.
+SERVICES = {
+    "items": {
+        "src": "Github_Lab/src",
+        "path": "/items",
+        "payload": item_payload,
+        "update": item_payload,
+        # Github_Lab assigns ids itself and returns them
+        "client_ids": False,
+    },
+    "coffee-shops": {
+        "src": "Docker_Lab/src",
+        "path": "/coffee-shops",
+        "payload": coffee_shop_payload,
+        "update": lambda n: _strip_id(coffee_shop_payload(n)),
+        "client_ids": True,
+    },
+    "books": {
+        "src": "Logging_Lab/src",
+        "path": "/books",
+        "payload": book_payload,
+        "update": lambda n: _strip_id(book_payload(n)),
+        "client_ids": True,
+    },
+    "predict": {
+        "src": "API_Labs/src",
+        "path": "/predict",
+        "payload": lambda n: WINE_SAMPLE,
+    },
+}
+
+
+def rss_mb(pid=None):
+    """
+    Current resident set size of a process in MB, read from /proc.
+    Falls back to the peak RSS of this process where /proc is unavailable.
+    """
+    pid = pid or os.getpid()
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and KB on Linux
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class InProcessTarget:
+    """Imports a lab's main.py and serves it through httpx's ASGI transport."""
+
+    def __init__(self, name):
+        self.name = name
+        self.src_dir = os.path.join(REPO_ROOT, SERVICES[name]["src"])
+        self.pid = None
+
+    def __enter__(self):
+        # The labs resolve models and log files relative to src/, like `cd src && python main.py`
+        self._old_cwd = os.getcwd()
+        os.chdir(self.src_dir)
+        sys.path.insert(0, self.src_dir)
+        root = logging.getLogger()
+        self._root_handlers, self._root_level = root.handlers[:], root.level
+        spec = importlib.util.spec_from_file_location(
+            f"bench_{self.name.replace('-', '_')}", os.path.join(self.src_dir, "main.py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        # Log files the app opens (books_api.log) go to a temp dir instead of the tracked tree
+        self._log_dir = tempfile.mkdtemp(prefix="loadtest-logs-")
+        with log_files_in(self._log_dir):
+            spec.loader.exec_module(module)
+        self.app = module.app
+        return self
+
+    def client(self, concurrency):
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app),
+            base_url="http://bench",
+            limits=httpx.Limits(max_connections=concurrency),
+        )
+
+    def __exit__(self, *exc):
+        # Undo the app's logging setup so later services are not slowed down by it
+        root = logging.getLogger()
+        for handler in root.handlers:
+            if handler not in self._root_handlers:
+                handler.close()
+        root.handlers[:] = self._root_handlers
+        root.setLevel(self._root_level)
+        shutil.rmtree(self._log_dir, ignore_errors=True)
+        sys.path.remove(self.src_dir)
+        os.chdir(self._old_cwd)
+
+
+# Runs in the uvicorn child: imports main.py from the cwd (the lab's src/) with
+# its log files redirected, then serves it. argv: bench dir, log dir, port.
+UVICORN_SCRIPT = """
+import sys
+sys.path.insert(1, sys.argv[1])
+import uvicorn
+from bench_common import log_files_in
+with log_files_in(sys.argv[2]):
+    import main
+uvicorn.run(main.app, host="127.0.0.1", port=int(sys.argv[3]), log_level="warning")
+"""
+
+
+class UvicornTarget:
+    """Runs a lab's main.py in a separate uvicorn process on a free local port."""
+
+    def __init__(self, name):
+        self.name = name
+        self.src_dir = os.path.join(REPO_ROOT, SERVICES[name]["src"])
+
+    def __enter__(self):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            self.port = s.getsockname()[1]
+        self._log_dir = tempfile.mkdtemp(prefix="loadtest-logs-")
+        bench_dir = os.path.dirname(os.path.abspath(__file__))
+        self.proc = subprocess.Popen(
+            [sys.executable, "-c", UVICORN_SCRIPT, bench_dir, self._log_dir, str(self.port)],
+            cwd=self.src_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self.pid = self.proc.pid
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                self.__exit__()
+                raise RuntimeError(f"uvicorn exited early while starting {self.name}")
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.2):
+                    return self
+            except OSError:
+                time.sleep(0.1)
+        self.__exit__()
+        raise RuntimeError(f"uvicorn did not start {self.name} within 30s")
+
+    def client(self, concurrency):
+        return httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{self.port}",
+            limits=httpx.Limits(max_connections=concurrency),
+        )
+
+    def __exit__(self, *exc):
+        self.proc.terminate()
+        self.proc.wait(timeout=10)
+        shutil.rmtree(self._log_dir, ignore_errors=True)
+
+
+class CollectionState:
+    """Tracks the ids the benchmark created so reads and updates hit real records."""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.ids = []
+        # Start well above the seed data ids ("1".."3") of Docker_Lab and Logging_Lab
+        self.counter = 1000
+
+    def next_payload(self):
+        self.counter += 1
+        return self.counter, self.spec["payload"](self.counter)
+
+    def remember(self, n, response):
+        if self.spec["client_ids"]:
+            self.ids.append(str(n))
+        else:
+            self.ids.append(response.json()["id"])
+
+
+async def create_record(client, state):
+    n, payload = state.next_payload()
+    response = await client.post(state.spec["path"], json=payload)
+    response.raise_for_status()
+    state.remember(n, response)
+    return response
+
+
+async def grow_collection(client, state, size, concurrency):
+    """Create records until the benchmark has added `size` of them."""
+    missing = size - len(state.ids)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await create_record(client, state)
+
+    await asyncio.gather(*(one() for _ in range(missing)))
+
+
+async def run_workload(client, state, read_ratio, total_requests, concurrency, seed):
+    """
+    Drive `total_requests` requests through `concurrency` concurrent workers.
+    Args:
+        client (httpx.AsyncClient): Client bound to the service under test.
+        state (CollectionState): Known records of the collection.
+        read_ratio (float): Share of requests that are GETs (None for /predict).
+        total_requests (int): Number of requests to send.
+        concurrency (int): Number of concurrent workers.
+        seed (int): Seed for the request mix.
+    Returns:
+        tuple: (latencies in seconds, error count, wall-clock seconds)
+    """
+    rng = random.Random(seed)
+    path = state.spec["path"]
+    latencies = []
+    errors = 0
+    remaining = total_requests
+
+    async def request():
+        if read_ratio is None:
+            return await client.post(path, json=state.spec["payload"](0))
+        if rng.random() < read_ratio:
+            if not state.ids or rng.random() < LIST_READ_SHARE:
+                return await client.get(path)
+            return await client.get(f"{path}/{rng.choice(state.ids)}")
+        if state.ids and rng.random() < 0.3:
+            record_id = rng.choice(state.ids)
+            return await client.put(f"{path}/{record_id}", json=state.spec["update"](state.counter))
+        return await create_record(client, state)
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                response = await request()
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - wall_start
+
+
+def summarize(latencies, errors, elapsed, pid):
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "rss_mb": round(rss_mb(pid), 1),
+    }
+
+
+async def collection_size(client, path):
+    response = await client.get(path)
+    response.raise_for_status()
+    return len(response.json())
+
+
+async def delete_records(client, state, ids, concurrency):
+    """Delete records the benchmark created and forget them."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(record_id):
+        async with semaphore:
+            response = await client.delete(f"{state.spec['path']}/{record_id}")
+            response.raise_for_status()
+
+    await asyncio.gather(*(one(record_id) for record_id in ids))
+    forgotten = set(ids)
+    state.ids = [i for i in state.ids if i not in forgotten]
+
+
+async def bench_service(target, name, workloads, sizes, requests, concurrency, seed):
+    """Fixed-size workloads (and /predict) against one app instance."""
+    spec = SERVICES[name]
+    results = {}
+    async with target.client(concurrency) as client:
+        if name == "predict":
+            latencies, errors, elapsed = await run_workload(
+                client, CollectionState(spec), None, requests, concurrency, seed
+            )
+            results[f"{name}:predict"] = summarize(latencies, errors, elapsed, target.pid)
+            return results
+
+        state = CollectionState(spec)
+        await grow_collection(client, state, min(sizes), concurrency)
+        for workload in workloads:
+            if workload == "growing":
+                continue
+            latencies, errors, elapsed = await run_workload(
+                client, state, WORKLOADS[workload], requests, concurrency, seed
+            )
+            results[f"{name}:{workload}"] = summarize(latencies, errors, elapsed, target.pid)
+    return results
+
+
+async def bench_growing(target, name, sizes, requests, concurrency, seed):
+    """
+    Read-heavy traffic against collections of exactly each size.
+    Must run on a freshly started app: the size includes the app's seed records,
+    and records created by each run are deleted before the next size.
+    """
+    spec = SERVICES[name]
+    results = {}
+    async with target.client(concurrency) as client:
+        state = CollectionState(spec)
+        seeded = await collection_size(client, spec["path"])
+        for size in sizes:
+            await grow_collection(client, state, size - seeded, concurrency)
+            start_size = await collection_size(client, spec["path"])
+            created_before = len(state.ids)
+            latencies, errors, elapsed = await run_workload(
+                client, state, WORKLOADS["read-heavy"], requests, concurrency, seed
+            )
+            result = summarize(latencies, errors, elapsed, target.pid)
+            result["collection_size"] = start_size
+            results[f"{name}:growing@{size}"] = result
+            # Drop what the workload's own writes added so the next size is exact
+            await delete_records(client, state, state.ids[created_before:], concurrency)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results against a saved baseline.
+    Returns:
+        list: Human readable regression messages (empty when nothing regressed).
+    """
+    regressions = []
+    for key, base in baseline.get("results", {}).items():
+        current = results.get(key)
+        if current is None:
+            continue
+        if current["rps"] < base["rps"] * (1 - threshold):
+            regressions.append(f"{key}: rps {current['rps']} < baseline {base['rps']}")
+        if current["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(f"{key}: p95 {current['p95_ms']}ms > baseline {base['p95_ms']}ms")
+    return regressions
+
+
+def print_table(results):
+    header = f"{'benchmark':32s} {'rps':>10s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'rss MB':>8s} {'errors':>7s}"
+    print(header)
+    print("-" * len(header))
+    for key, r in results.items():
+        print(f"{key:32s} {r['rps']:>10.1f} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} "
+              f"{r['p99_ms']:>9.2f} {r['rss_mb']:>8.1f} {r['errors']:>7d}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the lab FastAPI services")
+    parser.add_argument("--services", default=",".join(SERVICES),
+                        help="comma separated services: " + ", ".join(SERVICES))
+    parser.add_argument("--workloads", default="read-heavy,mixed,write-heavy,growing",
+                        help="comma separated workloads: " + ", ".join([*WORKLOADS, "growing"]))
+    parser.add_argument("--mode", choices=["inprocess", "uvicorn"], default="inprocess")
+    parser.add_argument("--requests", type=int, default=2000, help="requests per workload")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="collection sizes for the growing workload")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="fail if results regress against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed relative regression before failing (default 0.2)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    services = args.services.split(",")
+    workloads = args.workloads.split(",")
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    unknown = [s for s in services if s not in SERVICES]
+    unknown += [w for w in workloads if w not in WORKLOADS and w != "growing"]
+    if unknown:
+        print(f"Unknown services/workloads: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    target_cls = InProcessTarget if args.mode == "inprocess" else UvicornTarget
+    results = {}
+    for name in services:
+        print(f"Benchmarking {name} ({args.mode})...")
+        with target_cls(name) as target:
+            results.update(asyncio.run(bench_service(
+                target, name, workloads, sizes, args.requests, args.concurrency, args.seed
+            )))
+        if "growing" in workloads and name != "predict":
+            # A new app instance, so records from the workloads above do not count
+            with target_cls(name) as target:
+                results.update(asyncio.run(bench_growing(
+                    target, name, sizes, args.requests, args.concurrency, args.seed
+                )))
+
+    print()
+    print_table(results)
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "mode": args.mode,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("mode") != args.mode:
+            print(f"\nWarning: baseline was recorded in {baseline.get('meta', {}).get('mode')} mode")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%} of {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
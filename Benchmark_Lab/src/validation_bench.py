@@ -0,0 +1,76 @@
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+import warnings
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from bench_common import REPO_ROOT, item_payload
+
+# Per-item validation and serialization cost of the Github_Lab items API:
+# the single-item path (Item model + .dict() + jsonable_encoder + json)
+# against the bulk path (TypeAdapter into plain dicts + orjson).
+
+
+def load_items_app():
+    path = os.path.join(REPO_ROOT, "Github_Lab", "src", "main.py")
+    spec = importlib.util.spec_from_file_location("bench_items", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def per_item_us(fn, count, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure per-item validation cost of the items API")
+    parser.add_argument("--count", type=int, default=100000, help="items per batch")
+    parser.add_argument("--repeat", type=int, default=5, help="best of N runs")
+    args = parser.parse_args(argv)
+
+    main_module = load_items_app()
+    Item = main_module.Item
+    records = [item_payload(n) for n in range(args.count)]
+    body = json.dumps(records).encode()
+    stored = [{"id": n, **r} for n, r in enumerate(records)]
+
+    model_list_adapter = TypeAdapter(List[Item])
+
+    def single_validation():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for r in json.loads(body):
+                Item(**r).dict()
+
+    validation = {
+        "Item(**d).dict() per item": single_validation,
+        "TypeAdapter(List[Item])": lambda: model_list_adapter.validate_json(body),
+        "bulk TypeAdapter(List[ItemFields])": lambda: main_module.bulk_create_adapter.validate_json(body),
+    }
+    serialization = {
+        "jsonable_encoder + json.dumps": lambda: json.dumps(jsonable_encoder(stored)).encode(),
+        "FastJSONResponse.render": lambda: main_module.FastJSONResponse(None).render(stored),
+    }
+
+    print(f"{args.count:,} items, best of {args.repeat} (orjson {'on' if main_module.orjson else 'off'})\n")
+    for title, cases in (("Validation", validation), ("Serialization", serialization)):
+        print(f"{title}:")
+        for name, fn in cases.items():
+            print(f"  {name:36s} {per_item_us(fn, args.count, args.repeat):8.3f} us/item")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from bench_common import REPO_ROOT
+
+sys.path.insert(0, os.path.join(REPO_ROOT, "TFDV_Lab"))
+
+from windowing import create_time_windows, materialized_nbytes, to_series_array  # noqa: E402
+
+# Sliding-window builder: the TFDV_Lab1.ipynb loop against the strided view
+# in TFDV_Lab/windowing.py, at the notebook's scale (8,640 x 32) and larger.
+# The loop is timed on a prefix of large series and extrapolated linearly,
+# since materializing 100x would need several GB.
+
+NOTEBOOK_SAMPLES = 8640
+NOTEBOOK_FEATURES = 32
+
+
+def loop_time_windows(data, history_steps=24, forecast_steps=6, stride=1):
+    X, y = [], []
+    total_window_size = history_steps + forecast_steps
+    for i in range(0, len(data) - total_window_size + 1, stride):
+        X.append(data.iloc[i:i+history_steps].values)
+        future_idx = i + history_steps + forecast_steps - 1
+        y.append(data.iloc[future_idx, 0])
+    return np.array(X), np.array(y)
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def mb(nbytes):
+    return nbytes / (1024 * 1024)
+
+
+def bench_scale(scale, args):
+    n_samples = NOTEBOOK_SAMPLES * scale
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(rng.random((n_samples, args.features)))
+
+    loop_samples = min(n_samples, args.loop_limit)
+    loop_df = df.iloc[:loop_samples]
+    loop_s = best_time(lambda: loop_time_windows(loop_df, args.history, args.horizon, args.stride), 1)
+    loop_s *= n_samples / loop_samples
+
+    view_s = best_time(lambda: create_time_windows(df, args.history, args.horizon, args.stride), args.repeat)
+    X, _ = create_time_windows(df, args.history, args.horizon, args.stride)
+
+    loop_bytes = materialized_nbytes(n_samples, args.features, args.history, args.horizon, args.stride)
+    # X is a view; the only real allocation is the contiguous float32 series
+    view_bytes = to_series_array(df).nbytes
+    return {
+        "samples": n_samples,
+        "windows": len(X),
+        "loop_s": loop_s,
+        "loop_extrapolated": loop_samples < n_samples,
+        "view_s": view_s,
+        "loop_mb": mb(loop_bytes),
+        "view_mb": mb(view_bytes),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the sliding-window builder")
+    parser.add_argument("--scales", default="1,100", help="multiples of the notebook's 8,640 samples")
+    parser.add_argument("--features", type=int, default=NOTEBOOK_FEATURES)
+    parser.add_argument("--history", type=int, default=24)
+    parser.add_argument("--horizon", type=int, default=6)
+    parser.add_argument("--stride", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--loop-limit", type=int, default=NOTEBOOK_SAMPLES,
+                        help="max samples to run the slow loop on before extrapolating")
+    args = parser.parse_args(argv)
+
+    print(f"{'samples':>10s} {'windows':>10s} {'loop s':>10s} {'view s':>10s} {'speedup':>10s} "
+          f"{'loop MB':>10s} {'view MB':>10s} {'saved MB':>10s}")
+    for scale in (int(s) for s in args.scales.split(",")):
+        r = bench_scale(scale, args)
+        loop_s = f"{r['loop_s']:.3f}{'*' if r['loop_extrapolated'] else ''}"
+        print(f"{r['samples']:>10,d} {r['windows']:>10,d} {loop_s:>10s} {r['view_s']:>10.5f} "
+              f"{r['loop_s'] / r['view_s']:>9.0f}x {r['loop_mb']:>10.1f} {r['view_mb']:>10.1f} "
+              f"{r['loop_mb'] - r['view_mb']:>10.1f}")
+    print("\n* loop time extrapolated from the first --loop-limit samples")
+    print("Loop MB is the float64 X the loop materializes; view MB is the float32 series the view points into.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
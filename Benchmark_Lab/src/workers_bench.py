@@ -0,0 +1,173 @@
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+import numpy as np
+
+from bench_common import REPO_ROOT, WINE_SAMPLE, percentile
+from loadtest import SERVICES, CollectionState, run_workload
+
+API_SRC = os.path.join(REPO_ROOT, "API_Labs", "src")
+sys.path.insert(0, API_SRC)
+
+from model_store import NODE_DTYPE, save_tree  # noqa: E402
+
+# Multi-worker serving of the wine API (API_Labs/src/serve.py): aggregate
+# /predict throughput and per-worker memory as the worker count grows, with the
+# model memory-mapped and shared, or loaded privately in every worker.
+# --depth swaps the 9-node wine tree for a synthetic complete tree so that the
+# model is large enough for sharing to show up in the memory numbers.
+
+
+def synthetic_tree(depth, seed=42):
+    """Complete binary tree of the given depth over the 13 wine features, in BFS order."""
+    rng = np.random.default_rng(seed)
+    n_nodes = 2 ** (depth + 1) - 1
+    n_internal = 2 ** depth - 1
+    sample = np.array(list(WINE_SAMPLE.values()))
+    nodes = np.zeros(n_nodes, dtype=NODE_DTYPE)
+    internal = np.arange(n_internal)
+    nodes["left"], nodes["right"], nodes["feature"] = -1, -1, -1
+    nodes["left"][internal] = 2 * internal + 1
+    nodes["right"][internal] = 2 * internal + 2
+    nodes["feature"][internal] = rng.integers(0, len(sample), n_internal)
+    nodes["threshold"][internal] = sample[nodes["feature"][internal]] * rng.normal(1, 0.1, n_internal)
+    nodes["label"] = rng.integers(0, 3, n_nodes)
+    return nodes
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def child_pids(parent):
+    pids = []
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # The ppid follows the ")" closing the command name
+                    if int(f.read().rsplit(")", 1)[1].split()[1]) == parent:
+                        pids.append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+    return pids
+
+
+def memory_mb(pid):
+    """
+    Rss and Pss of a process in MB. Pss splits shared pages between the processes
+    mapping them, so summing Pss over workers counts a shared model once.
+    """
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss"):
+                fields[key] = int(rest.split()[0]) / 1024
+    return fields["Rss"], fields["Pss"]
+
+
+def drive(port, requests, concurrency, seed):
+    """Send /predict requests from one client process."""
+
+    async def run():
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}",
+                                     limits=httpx.Limits(max_connections=concurrency)) as client:
+            return await run_workload(client, CollectionState(SERVICES["predict"]), None,
+                                      requests, concurrency, seed)
+
+    return asyncio.run(run())
+
+
+def bench(workers, private, artifact, args):
+    port = free_port()
+    cmd = [sys.executable, "serve.py", "--workers", str(workers), "--port", str(port),
+           "--artifact", artifact, "--log-level", "warning"]
+    if private:
+        cmd.append("--private-model")
+    proc = subprocess.Popen(cmd, cwd=API_SRC, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 60
+        while len(child_pids(proc.pid)) < workers or not _accepting(port):
+            if proc.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError(f"serve.py did not start {workers} workers")
+            time.sleep(0.2)
+
+        drive(port, 200, args.concurrency, args.seed)
+        per_client = args.requests // args.clients
+        with ProcessPoolExecutor(args.clients) as pool:
+            start = time.perf_counter()
+            futures = [pool.submit(drive, port, per_client, args.concurrency, args.seed + i)
+                       for i in range(args.clients)]
+            results = [f.result() for f in futures]
+            elapsed = time.perf_counter() - start
+
+        latencies = sorted(t for r in results for t in r[0])
+        memory = [memory_mb(pid) for pid in child_pids(proc.pid)]
+        return {
+            "workers": workers,
+            "model": "private" if private else "shared",
+            "rps": len(latencies) / elapsed,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "errors": sum(r[1] for r in results),
+            "rss_mb": max(m[0] for m in memory),
+            "pss_mb": sum(m[1] for m in memory) / len(memory),
+            "total_pss_mb": sum(m[1] for m in memory),
+        }
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+def _accepting(port):
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark multi-worker serving of the wine API")
+    parser.add_argument("--workers", default=f"1,2,{os.cpu_count()}")
+    parser.add_argument("--depth", type=int, default=0,
+                        help="serve a synthetic complete tree of this depth instead of the wine model (0)")
+    parser.add_argument("--modes", default="shared,private", help="comma separated: shared, private")
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--clients", type=int, default=2, help="client processes generating load")
+    parser.add_argument("--concurrency", type=int, default=16, help="connections per client process")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        artifact = os.path.join(API_SRC, "..", "model", "wine_model.npy")
+        if args.depth:
+            artifact = os.path.join(tmp, "synthetic_tree.npy")
+            save_tree(synthetic_tree(args.depth, args.seed), artifact)
+        print(f"Model artifact: {os.path.getsize(artifact) / 1024**2:.1f} MB, {os.cpu_count()} cores\n")
+
+        header = (f"{'workers':>7s} {'model':>8s} {'rps':>9s} {'p95 ms':>8s} {'errors':>7s} "
+                  f"{'RSS MB':>8s} {'PSS MB':>8s} {'total PSS':>10s}")
+        print(header)
+        print("-" * len(header))
+        for workers in sorted({int(w) for w in args.workers.split(",")}):
+            for mode in args.modes.split(","):
+                r = bench(workers, mode == "private", os.path.abspath(artifact), args)
+                print(f"{r['workers']:>7d} {r['model']:>8s} {r['rps']:>9.1f} {r['p95_ms']:>8.2f} "
+                      f"{r['errors']:>7d} {r['rss_mb']:>8.1f} {r['pss_mb']:>8.1f} {r['total_pss_mb']:>10.1f}")
+    print("\nRSS is the largest worker; PSS is per worker on average and summed over all workers.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import BaseModel, TypeAdapter
+from typing import Callable, List, Optional
+import threading
+import uuid
 import uvicorn
 
 # CoffeeShop model using Pydantic for request/response validation
@@ -18,6 +20,52 @@ class CoffeeShopUpdate(BaseModel):
     specialty: str
     rating: float
 
+# Cached JSON body and ETag for GET /coffee-shops; every write must call invalidate()
+class CollectionCache:
+    """Pre-serialized collection body, rebuilt only after a write bumps the version."""
+
+    # Distinguishes ETags of different server runs, since versions restart at 0
+    instance = uuid.uuid4().hex[:8]
+
+    def __init__(self, serialize: Callable[[], bytes]):
+        self.version = 0
+        # Writes run on the threadpool; += is not atomic
+        self._version_lock = threading.Lock()
+        self._serialize = serialize
+        # (version, body) swapped in as one tuple, so a reader never pairs a
+        # body with another version's ETag
+        self._cached = (-1, b"")
+
+    def invalidate(self):
+        with self._version_lock:
+            self.version += 1
+
+    def etag(self, version: int) -> str:
+        return f'"{self.instance}-{version}"'
+
+    def is_current(self, request: Request, version: Optional[int] = None) -> bool:
+        """True when the client's If-None-Match already names this version."""
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        etag = self.etag(self.version if version is None else version)
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+    def response(self, request: Request) -> Response:
+        """Serve the cached body, or 304 when the client already has this version."""
+        # Read the version before serializing: the body may be newer than its
+        # ETag claims, but never older
+        version = self.version
+        headers = {"ETag": self.etag(version), "Cache-Control": "no-cache"}
+        if self.is_current(request, version):
+            return Response(status_code=304, headers=headers)
+        cached_version, body = self._cached
+        if cached_version != version:
+            body = self._serialize()
+            self._cached = (version, body)
+        return Response(content=body, media_type="application/json", headers=headers)
+
 # Initialize FastAPI app
 app = FastAPI(title="Boston Coffee Shops API", version="1.0.0")
 
@@ -27,17 +75,21 @@ coffee_shops = [
     CoffeeShop(id="3", name="Pavement Coffeehouse", neighborhood="Fenway", specialty="Cold Brew", rating=4.3),
 ]
 
+coffee_shops_adapter = TypeAdapter(List[CoffeeShop])
+coffee_shops_cache = CollectionCache(lambda: coffee_shops_adapter.dump_json(coffee_shops))
+
 # GET /coffee-shops - Get all coffee shops
 @app.get("/coffee-shops", response_model=List[CoffeeShop])
-async def get_coffee_shops():
-    """Get all coffee shops"""
-    return coffee_shops
+async def get_coffee_shops(request: Request):
+    """Get all coffee shops (304 Not Modified when If-None-Match matches the ETag)"""
+    return coffee_shops_cache.response(request)
 
 # POST /coffee-shops - Create a new coffee shop
 @app.post("/coffee-shops", response_model=CoffeeShop, status_code=201)
 async def post_coffee_shop(shop: CoffeeShop):
     """Add a new coffee shop"""
     coffee_shops.append(shop)
+    coffee_shops_cache.invalidate()
     return shop
 
 # GET /coffee-shops/{id} - Get coffee shop by ID
@@ -60,6 +112,7 @@ async def update_existing_coffee_shop(id: str, updated_shop: CoffeeShopUpdate):
             coffee_shops[i].neighborhood = updated_shop.neighborhood
             coffee_shops[i].specialty = updated_shop.specialty
             coffee_shops[i].rating = updated_shop.rating
+            coffee_shops_cache.invalidate()
             return coffee_shops[i]
     
     raise HTTPException(status_code=404, detail="coffee shop not found")
@@ -71,6 +124,7 @@ async def delete_coffee_shop(id: str):
     for i, shop in enumerate(coffee_shops):
         if shop.id == id:
             coffee_shops.pop(i)
+            coffee_shops_cache.invalidate()
             return {"message": "coffee shop deleted successfully"}
     
     raise HTTPException(status_code=404, detail="coffee shop not found")
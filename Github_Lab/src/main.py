@@ -1,12 +1,80 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Dict
-
-app = FastAPI()
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing import Callable, Dict, List, Optional
+from typing_extensions import TypedDict
+import threading
+import uuid
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed."""
+
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
+
+
+class CollectionCache:
+    """Pre-serialized collection body, rebuilt only after a write bumps the version."""
+
+    # Distinguishes ETags of different server runs, since versions restart at 0
+    instance = uuid.uuid4().hex[:8]
+
+    def __init__(self, serialize: Callable[[], bytes]):
+        self.version = 0
+        # Writes run on the threadpool; += is not atomic
+        self._version_lock = threading.Lock()
+        self._serialize = serialize
+        # (version, body) swapped in as one tuple, so a reader never pairs a
+        # body with another version's ETag
+        self._cached = (-1, b"")
+
+    def invalidate(self):
+        with self._version_lock:
+            self.version += 1
+
+    def etag(self, version: int) -> str:
+        return f'"{self.instance}-{version}"'
+
+    def is_current(self, request: Request, version: Optional[int] = None) -> bool:
+        """True when the client's If-None-Match already names this version."""
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        etag = self.etag(self.version if version is None else version)
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+    def response(self, request: Request) -> Response:
+        """Serve the cached body, or 304 when the client already has this version."""
+        # Read the version before serializing: the body may be newer than its
+        # ETag claims, but never older
+        version = self.version
+        headers = {"ETag": self.etag(version), "Cache-Control": "no-cache"}
+        if self.is_current(request, version):
+            return Response(status_code=304, headers=headers)
+        cached_version, body = self._cached
+        if cached_version != version:
+            body = self._serialize()
+            self._cached = (version, body)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # In-memory storage
 items: Dict[int, dict] = {}
 next_id = 1
+id_lock = threading.Lock()
+items_cache = CollectionCache(lambda: FastJSONResponse(list(items.values())).body)
 
 
 class Item(BaseModel):
@@ -14,6 +82,91 @@ class Item(BaseModel):
     description: str
 
 
+# Bulk payloads are validated straight from the raw body into plain dicts,
+# skipping the per-item model instance and .dict() copy
+class ItemFields(TypedDict):
+    name: str
+    description: str
+
+
+class ItemUpdate(TypedDict):
+    id: int
+    name: str
+    description: str
+
+
+# Adapters for one entry (one NDJSON line) and for a JSON array of entries
+create_entry_adapter = TypeAdapter(ItemFields)
+update_entry_adapter = TypeAdapter(ItemUpdate)
+delete_entry_adapter = TypeAdapter(int)
+bulk_create_adapter = TypeAdapter(List[ItemFields])
+bulk_update_adapter = TypeAdapter(List[ItemUpdate])
+bulk_delete_adapter = TypeAdapter(List[int])
+
+
+def bulk_body_openapi(entry_adapter: TypeAdapter) -> dict:
+    """requestBody for a bulk route, which reads the raw request instead of a typed parameter."""
+    entry_schema = entry_adapter.json_schema()
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": entry_schema}},
+                "application/x-ndjson": {
+                    "schema": {
+                        "type": "string",
+                        "description": "One JSON value per line, each matching the application/json array items",
+                    },
+                },
+            },
+        },
+    }
+
+
+def allocate_ids(count: int) -> range:
+    """Reserve `count` consecutive ids in one step."""
+    global next_id
+    with id_lock:
+        start = next_id
+        next_id += count
+    return range(start, start + count)
+
+
+def with_loc_prefix(errors: list, prefix: tuple) -> list:
+    for error in errors:
+        error["loc"] = (*prefix, *error["loc"])
+    return errors
+
+
+async def read_bulk_body(request: Request, adapter: TypeAdapter, entry_adapter: TypeAdapter):
+    """
+    Validate a JSON array, or an NDJSON body with exactly one entry per line.
+    NDJSON errors are located by 1-based line number, e.g. ("body", "line 3", "name").
+    """
+    body = await request.body()
+    if "ndjson" not in request.headers.get("content-type", ""):
+        try:
+            return adapter.validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(with_loc_prefix(e.errors(include_url=False), ("body",)))
+
+    entries, errors = [], []
+    for number, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            entries.append(entry_adapter.validate_json(line))
+        except ValidationError as e:
+            errors.extend(with_loc_prefix(e.errors(include_url=False), ("body", f"line {number}")))
+    if errors:
+        raise RequestValidationError(errors)
+    return entries
+
+
+def missing_ids(ids) -> List[int]:
+    return [item_id for item_id in ids if item_id not in items]
+
+
 @app.get("/")
 def root():
     return {"message": "Hello World"}
@@ -21,16 +174,53 @@ def root():
 
 @app.post("/items")
 def create_item(item: Item):
-    global next_id
-    item_id = next_id
+    item_id = allocate_ids(1)[0]
     items[item_id] = {"id": item_id, **item.dict()}
-    next_id += 1
+    items_cache.invalidate()
     return items[item_id]
 
 
+@app.post("/items/bulk", openapi_extra=bulk_body_openapi(create_entry_adapter))
+async def create_items_bulk(request: Request):
+    new_items = await read_bulk_body(request, bulk_create_adapter, create_entry_adapter)
+    created = []
+    for item_id, fields in zip(allocate_ids(len(new_items)), new_items):
+        item = {"id": item_id, **fields}
+        items[item_id] = item
+        created.append(item)
+    items_cache.invalidate()
+    return FastJSONResponse(created)
+
+
+@app.put("/items/bulk", openapi_extra=bulk_body_openapi(update_entry_adapter))
+async def update_items_bulk(request: Request):
+    updates = await read_bulk_body(request, bulk_update_adapter, update_entry_adapter)
+    # All or nothing: check every id before applying any update
+    missing = missing_ids(update["id"] for update in updates)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Items not found: {missing}")
+    for update in updates:
+        items[update["id"]] = update
+    items_cache.invalidate()
+    return FastJSONResponse(updates)
+
+
+@app.delete("/items/bulk", openapi_extra=bulk_body_openapi(delete_entry_adapter))
+async def delete_items_bulk(request: Request):
+    ids = await read_bulk_body(request, bulk_delete_adapter, delete_entry_adapter)
+    missing = missing_ids(ids)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Items not found: {missing}")
+    deleted = set(ids)
+    for item_id in deleted:
+        del items[item_id]
+    items_cache.invalidate()
+    return {"message": "Items deleted", "count": len(deleted)}
+
+
 @app.get("/items")
-def read_items():
-    return list(items.values())
+def read_items(request: Request):
+    return items_cache.response(request)
 
 
 @app.get("/items/{item_id}")
@@ -45,6 +235,7 @@ def update_item(item_id: int, item: Item):
     if item_id not in items:
         raise HTTPException(status_code=404, detail="Item not found")
     items[item_id] = {"id": item_id, **item.dict()}
+    items_cache.invalidate()
     return items[item_id]
 
 
@@ -53,4 +244,5 @@ def delete_item(item_id: int):
     if item_id not in items:
         raise HTTPException(status_code=404, detail="Item not found")
     del items[item_id]
+    items_cache.invalidate()
     return {"message": "Item deleted"}
\ No newline at end of file
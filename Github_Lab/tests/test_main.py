@@ -13,6 +13,7 @@ def setup_function():
     # Reset next_id
     import main
     main.next_id = 1
+    main.items_cache.invalidate()
 
 
 def test_root():
@@ -248,4 +249,211 @@ def test_update_item_not_found():
         json={"name": "Test", "description": "Test"}
     )
     assert response.status_code == 404
-    assert response.json()["detail"] == "Item not found"
\ No newline at end of file
+    assert response.json()["detail"] == "Item not found"
+
+def test_bulk_create_items():
+    """Test bulk creating items allocates a consecutive id range"""
+    client.post("/items", json={"name": "Single", "description": "Created first"})
+    response = client.post(
+        "/items/bulk",
+        json=[
+            {"name": "Bulk 1", "description": "First bulk item"},
+            {"name": "Bulk 2", "description": "Second bulk item"},
+            {"name": "Bulk 3", "description": "Third bulk item"},
+        ]
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["id"] for item in data] == [2, 3, 4]
+    assert data[0] == {"id": 2, "name": "Bulk 1", "description": "First bulk item"}
+    assert len(client.get("/items").json()) == 4
+
+    # Single creates continue after the allocated range
+    assert client.post("/items", json={"name": "Next", "description": "After bulk"}).json()["id"] == 5
+
+
+def test_bulk_create_items_ndjson():
+    """Test bulk creating items from an NDJSON body"""
+    body = (
+        '{"name": "Line 1", "description": "First line"}\n'
+        '\n'
+        '{"name": "Line 2", "description": "Second line"}\n'
+    )
+    response = client.post(
+        "/items/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["name"] for item in data] == ["Line 1", "Line 2"]
+    assert client.get("/items/2").json()["description"] == "Second line"
+
+
+def test_bulk_create_items_ndjson_one_object_per_line():
+    """Test NDJSON lines must hold exactly one object and errors name the line"""
+    body = (
+        '{"name": "Line 1", "description": "First line"}\n'
+        '{"name": "A", "description": "a"},{"name": "B", "description": "b"}\n'
+        '{"name": "Only Name"}\n'
+    )
+    response = client.post(
+        "/items/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 422
+    locs = [error["loc"] for error in response.json()["detail"]]
+    assert locs[0][:2] == ["body", "line 2"]
+    assert ["body", "line 3", "description"] in locs
+    assert client.get("/items").json() == []
+
+
+def test_bulk_routes_document_request_body():
+    """Test the bulk routes declare their JSON and NDJSON bodies in OpenAPI"""
+    paths = app.openapi()["paths"]["/items/bulk"]
+    for method in ("post", "put", "delete"):
+        content = paths[method]["requestBody"]["content"]
+        assert content["application/json"]["schema"]["type"] == "array"
+        assert "application/x-ndjson" in content
+    assert paths["post"]["requestBody"]["content"]["application/json"]["schema"]["items"]["required"] == ["name", "description"]
+
+
+def test_bulk_create_items_invalid_is_atomic():
+    """Test an invalid entry rejects the whole bulk create"""
+    response = client.post(
+        "/items/bulk",
+        json=[
+            {"name": "Valid", "description": "Valid item"},
+            {"name": "Only Name"},
+        ]
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 1, "description"]
+    assert client.get("/items").json() == []
+
+
+def test_bulk_update_items():
+    """Test bulk updating existing items"""
+    client.post("/items/bulk", json=[
+        {"name": "Item 1", "description": "Desc 1"},
+        {"name": "Item 2", "description": "Desc 2"},
+    ])
+    response = client.put(
+        "/items/bulk",
+        json=[
+            {"id": 1, "name": "Updated 1", "description": "New 1"},
+            {"id": 2, "name": "Updated 2", "description": "New 2"},
+        ]
+    )
+    assert response.status_code == 200
+    assert client.get("/items/1").json()["name"] == "Updated 1"
+    assert client.get("/items/2").json()["description"] == "New 2"
+
+
+def test_bulk_update_items_not_found_is_atomic():
+    """Test a missing id rejects the whole bulk update"""
+    client.post("/items", json={"name": "Original", "description": "Original Desc"})
+    response = client.put(
+        "/items/bulk",
+        json=[
+            {"id": 1, "name": "Updated", "description": "Updated Desc"},
+            {"id": 999, "name": "Missing", "description": "Missing"},
+        ]
+    )
+    assert response.status_code == 404
+    assert client.get("/items/1").json()["name"] == "Original"
+
+
+def test_bulk_delete_items():
+    """Test bulk deleting items"""
+    client.post("/items/bulk", json=[
+        {"name": "Item 1", "description": "Desc 1"},
+        {"name": "Item 2", "description": "Desc 2"},
+        {"name": "Item 3", "description": "Desc 3"},
+    ])
+    response = client.request("DELETE", "/items/bulk", json=[1, 3])
+    assert response.status_code == 200
+    assert response.json() == {"message": "Items deleted", "count": 2}
+    assert [item["id"] for item in client.get("/items").json()] == [2]
+
+    # Nothing is deleted when any id is missing
+    response = client.request("DELETE", "/items/bulk", json=[2, 999])
+    assert response.status_code == 404
+    assert client.get("/items/2").status_code == 200
+
+
+def test_read_items_etag_not_modified():
+    """Test conditional GET returns 304 while the collection is unchanged"""
+    client.post("/items", json={"name": "Item 1", "description": "Desc 1"})
+
+    response = client.get("/items")
+    etag = response.headers["etag"]
+    assert response.status_code == 200
+
+    cached = client.get("/items", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+
+def test_read_items_etag_changes_after_write():
+    """Test every kind of write invalidates the cached collection"""
+    etag = client.get("/items").headers["etag"]
+
+    writes = [
+        lambda: client.post("/items", json={"name": "Item 1", "description": "Desc 1"}),
+        lambda: client.put("/items/1", json={"name": "Updated", "description": "New"}),
+        lambda: client.post("/items/bulk", json=[{"name": "Item 2", "description": "Desc 2"}]),
+        lambda: client.put("/items/bulk", json=[{"id": 2, "name": "Bulk Updated", "description": "New"}]),
+        lambda: client.request("DELETE", "/items/bulk", json=[2]),
+        lambda: client.delete("/items/1"),
+    ]
+    for write in writes:
+        assert write().status_code == 200
+        response = client.get("/items", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json() == list(items.values())
+        etag = response.headers["etag"]
+
+
+def test_collection_cache_never_pairs_stale_body_with_newer_etag():
+    """Test a write during serialization leaves the body labeled with the older version"""
+    import main
+
+    bodies = iter([b"[1]", b"[1,2]"])
+    cache = main.CollectionCache(lambda: next(bodies))
+    request = main.Request({"type": "http", "headers": []})
+
+    original = cache._serialize
+
+    def serialize_racing_write():
+        # Another request writes while this one is serializing
+        cache.invalidate()
+        return original()
+
+    cache._serialize = serialize_racing_write
+    first = cache.response(request)
+    assert first.headers["etag"] == cache.etag(0)
+
+    cache._serialize = original
+    second = cache.response(request)
+    assert second.headers["etag"] == cache.etag(1)
+    assert second.body == b"[1,2]"
+
+
+def test_collection_cache_invalidate_from_many_threads():
+    """Test concurrent writes each bump the collection version exactly once"""
+    import main
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = main.CollectionCache(lambda: b"[]")
+
+    def write(_):
+        for _ in range(1000):
+            cache.invalidate()
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(write, range(8)))
+    assert cache.version == 8000
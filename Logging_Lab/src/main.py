@@ -1,8 +1,10 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import BaseModel, TypeAdapter
+from typing import Callable, List, Optional
 import uvicorn
 import logging
+import threading
+import uuid
 
 # Configure logging with both console and file output
 logging.basicConfig(
@@ -32,6 +34,52 @@ class BookUpdate(BaseModel):
     price: float
     pages: int
 
+# Cached JSON body and ETag for GET /books; every write must call invalidate()
+class CollectionCache:
+    """Pre-serialized collection body, rebuilt only after a write bumps the version."""
+
+    # Distinguishes ETags of different server runs, since versions restart at 0
+    instance = uuid.uuid4().hex[:8]
+
+    def __init__(self, serialize: Callable[[], bytes]):
+        self.version = 0
+        # Writes run on the threadpool; += is not atomic
+        self._version_lock = threading.Lock()
+        self._serialize = serialize
+        # (version, body) swapped in as one tuple, so a reader never pairs a
+        # body with another version's ETag
+        self._cached = (-1, b"")
+
+    def invalidate(self):
+        with self._version_lock:
+            self.version += 1
+
+    def etag(self, version: int) -> str:
+        return f'"{self.instance}-{version}"'
+
+    def is_current(self, request: Request, version: Optional[int] = None) -> bool:
+        """True when the client's If-None-Match already names this version."""
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        etag = self.etag(self.version if version is None else version)
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+    def response(self, request: Request) -> Response:
+        """Serve the cached body, or 304 when the client already has this version."""
+        # Read the version before serializing: the body may be newer than its
+        # ETag claims, but never older
+        version = self.version
+        headers = {"ETag": self.etag(version), "Cache-Control": "no-cache"}
+        if self.is_current(request, version):
+            return Response(status_code=304, headers=headers)
+        cached_version, body = self._cached
+        if cached_version != version:
+            body = self._serialize()
+            self._cached = (version, body)
+        return Response(content=body, media_type="application/json", headers=headers)
+
 # Initialize FastAPI app
 app = FastAPI(title="Books API", version="1.0.0")
 
@@ -41,15 +89,21 @@ books = [
     Book(id="3", title="To Kill a Mockingbird", author="Harper Lee", price=13.99, pages=281),
 ]
 
+books_adapter = TypeAdapter(List[Book])
+books_cache = CollectionCache(lambda: books_adapter.dump_json(books))
+
 logger.info("Books API initialized with %d books", len(books))
 
 # GET /books - Get all books
 @app.get("/books", response_model=List[Book])
-async def get_books():
-    """Get all books"""
+async def get_books(request: Request):
+    """Get all books (304 Not Modified when If-None-Match matches the ETag)"""
+    if books_cache.is_current(request):
+        logger.info("GET /books - Not modified (version %d)", books_cache.version)
+        return books_cache.response(request)
     logger.debug("Retrieving all books from database")
     logger.info("GET /books - Returning %d books", len(books))
-    return books
+    return books_cache.response(request)
 
 # POST /books - Create a new book
 @app.post("/books", response_model=Book, status_code=201)
@@ -68,6 +122,7 @@ async def create_book(book: Book):
             logger.warning("Duplicate book ID detected: %s. Replacing existing entry.", book.id)
     
     books.append(book)
+    books_cache.invalidate()
     logger.info("POST /books - Successfully added: '%s' by %s", book.title, book.author)
     return book
 
@@ -106,6 +161,7 @@ async def update_book(id: str, updated_book: BookUpdate):
             books[i].author = updated_book.author
             books[i].price = updated_book.price
             books[i].pages = updated_book.pages
+            books_cache.invalidate()
             
             logger.info("PUT /books/%s - Successfully updated: '%s'", id, books[i].title)
             return books[i]
@@ -126,6 +182,7 @@ async def delete_book(id: str):
     for i, book in enumerate(books):
         if book.id == id:
             deleted_book = books.pop(i)
+            books_cache.invalidate()
             logger.info("DELETE /books/%s - Successfully removed: '%s'", id, deleted_book.title)
             return {"message": "book deleted successfully", "title": deleted_book.title}
     
@@ -0,0 +1,276 @@
+import argparse
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Chunked, multi-core profiling of large numeric CSVs (e.g. jena_climate_2009_2016.csv).
+# The file is split into byte ranges on line boundaries, each range is parsed and
+# summarized in a worker process, and the mergeable per-column summaries are
+# combined into one statistics/schema artifact. Memory per worker is bounded by
+# chunk_bytes. Assumes no quoted fields contain newlines.
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+DEFAULT_SKETCH_SIZE = 512
+DEFAULT_QUANTILES = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile summary of at most `size` weighted points.
+
+    Points are kept at evenly spaced ranks, so each quantile is off by at
+    most about 1/size of the data per merge level.
+    """
+
+    def __init__(self, size=DEFAULT_SKETCH_SIZE):
+        self.size = size
+        self.values = np.empty(0)
+        self.weights = np.empty(0)
+
+    def update(self, values):
+        self._combine(np.asarray(values, dtype=np.float64), np.ones(len(values)))
+
+    def merge(self, other):
+        self._combine(other.values, other.weights)
+
+    def _combine(self, values, weights):
+        values = np.concatenate([self.values, values])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(values, kind="stable")
+        values, weights = values[order], weights[order]
+        if len(values) > self.size:
+            cumulative = np.cumsum(weights)
+            total = cumulative[-1]
+            ranks = (np.arange(self.size) + 0.5) * total / self.size
+            values = values[np.searchsorted(cumulative, ranks)]
+            weights = np.full(self.size, total / self.size)
+        self.values, self.weights = values, weights
+
+    def quantiles(self, qs):
+        if len(self.values) == 0:
+            return [None] * len(qs)
+        ranks = np.cumsum(self.weights) - self.weights / 2
+        return np.interp(np.asarray(qs) * self.weights.sum(), ranks, self.values).tolist()
+
+    def histogram(self, bins, value_range):
+        counts, edges = np.histogram(self.values, bins=bins, range=value_range, weights=self.weights)
+        return np.rint(counts).astype(int).tolist(), edges.tolist()
+
+
+class ColumnStats:
+    """Mergeable summary of one numeric column (parallel Welford mean/variance)."""
+
+    def __init__(self, sketch_size=DEFAULT_SKETCH_SIZE):
+        self.count = 0
+        self.missing = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.integral = True
+        self.sketch = QuantileSketch(sketch_size)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        present = values[~np.isnan(values)]
+        self.missing += len(values) - len(present)
+        if len(present) == 0:
+            return
+        chunk = ColumnStats(self.sketch.size)
+        chunk.count = len(present)
+        chunk.min = present.min()
+        chunk.max = present.max()
+        chunk.mean = present.mean()
+        chunk.m2 = float(((present - chunk.mean) ** 2).sum())
+        chunk.integral = bool(np.all(present == np.floor(present)))
+        chunk.sketch.update(present)
+        self.merge(chunk, include_missing=False)
+
+    def merge(self, other, include_missing=True):
+        if include_missing:
+            self.missing += other.missing
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.integral = self.integral and other.integral
+        self.sketch.merge(other.sketch)
+
+    @property
+    def std(self):
+        # Sample standard deviation, like pandas' describe()
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else None
+
+    def to_dict(self, quantiles=DEFAULT_QUANTILES, bins=20):
+        total = self.count + self.missing
+        stats = {
+            "count": self.count,
+            "missing": self.missing,
+            "missing_fraction": self.missing / total if total else 0.0,
+            "min": float(self.min) if self.count else None,
+            "max": float(self.max) if self.count else None,
+            "mean": float(self.mean) if self.count else None,
+            "std": self.std,
+            "quantiles": dict(zip((str(q) for q in quantiles), self.sketch.quantiles(quantiles))),
+        }
+        if self.count:
+            counts, edges = self.sketch.histogram(bins, (self.min, self.max))
+            stats["histogram"] = {"edges": edges, "counts": counts}
+        return stats
+
+
+def numeric_columns(path, sample_rows=1000):
+    """Columns whose first `sample_rows` values parse as numbers."""
+    sample = pd.read_csv(path, nrows=sample_rows)
+    return [c for c in sample.columns if pd.api.types.is_numeric_dtype(sample[c])]
+
+
+def byte_ranges(path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Split a CSV's data rows into (start, end) byte ranges that end on line boundaries.
+    Returns:
+        tuple: (header line as str, list of (start, end) ranges)
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as f:
+        header = f.readline()
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return header.decode("utf-8").rstrip("\r\n"), ranges
+
+
+def _profile_range(task):
+    # Top-level so it can be pickled into worker processes
+    path, start, end, names, columns, sketch_size = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    chunk = pd.read_csv(io.BytesIO(data), header=None, names=names, usecols=columns)
+    summaries = {}
+    for column in columns:
+        values = chunk[column]
+        if not pd.api.types.is_numeric_dtype(values):
+            # Unparseable entries count as missing
+            values = pd.to_numeric(values, errors="coerce")
+        stats = ColumnStats(sketch_size)
+        stats.update(values.to_numpy(dtype=np.float64, na_value=np.nan))
+        summaries[column] = stats
+    return len(chunk), summaries
+
+
+def profile_csv(path, columns=None, chunk_bytes=DEFAULT_CHUNK_BYTES, workers=None,
+                sketch_size=DEFAULT_SKETCH_SIZE, quantiles=DEFAULT_QUANTILES, bins=20):
+    """
+    Compute per-column statistics and an inferred schema for a numeric CSV.
+    Args:
+        path (str): CSV file with a header row.
+        columns (list): Columns to profile (default: all numeric columns).
+        chunk_bytes (int): Bytes parsed per task; bounds memory per worker.
+        workers (int): Worker processes (default: all cores; 1 runs in-process).
+        sketch_size (int): Points kept per quantile sketch.
+        quantiles (list): Quantiles to report.
+        bins (int): Histogram bins between min and max (approximate, from the sketch).
+    Returns:
+        dict: JSON-serializable artifact with "num_rows", "features" and "schema".
+    """
+    header, ranges = byte_ranges(path, chunk_bytes)
+    names = list(pd.read_csv(io.StringIO(header + "\n"), nrows=0).columns)
+    columns = list(columns) if columns else numeric_columns(path)
+    missing = [c for c in columns if c not in names]
+    if missing:
+        raise ValueError(f"Columns not in {path}: {missing}")
+
+    tasks = [(path, start, end, names, columns, sketch_size) for start, end in ranges]
+    totals = {column: ColumnStats(sketch_size) for column in columns}
+    num_rows = 0
+    workers = workers or os.cpu_count()
+
+    if workers == 1 or len(tasks) <= 1:
+        results = map(_profile_range, tasks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(tasks)))
+        results = executor.map(_profile_range, tasks)
+    try:
+        for rows, summaries in results:
+            num_rows += rows
+            for column, stats in summaries.items():
+                totals[column].merge(stats)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    features = {column: stats.to_dict(quantiles, bins) for column, stats in totals.items()}
+    return {
+        "source": os.path.basename(path),
+        "num_rows": num_rows,
+        "features": features,
+        "schema": infer_schema(totals),
+    }
+
+
+def infer_schema(totals):
+    """
+    Infer a TFDV-style schema (type, presence, domain) from merged column stats.
+    """
+    schema = {}
+    for column, stats in totals.items():
+        total = stats.count + stats.missing
+        schema[column] = {
+            "type": "INT" if stats.count and stats.integral else "FLOAT",
+            "presence": {
+                "required": stats.missing == 0,
+                "min_fraction": stats.count / total if total else 0.0,
+            },
+            "domain": {
+                "min": float(stats.min) if stats.count else None,
+                "max": float(stats.max) if stats.count else None,
+            },
+        }
+    return schema
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile a numeric CSV in parallel chunks")
+    parser.add_argument("path", help="CSV file with a header row")
+    parser.add_argument("--columns", help="comma separated columns (default: all numeric)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-mb", type=float, default=DEFAULT_CHUNK_BYTES / 1024**2)
+    parser.add_argument("--bins", type=int, default=20)
+    parser.add_argument("--output", help="write the statistics/schema JSON here")
+    args = parser.parse_args(argv)
+
+    artifact = profile_csv(
+        args.path,
+        columns=args.columns.split(",") if args.columns else None,
+        chunk_bytes=int(args.chunk_mb * 1024 * 1024),
+        workers=args.workers,
+        bins=args.bins,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(artifact, f, indent=2)
+        print(f"Saved statistics for {artifact['num_rows']:,} rows to {args.output}")
+    else:
+        print(json.dumps(artifact, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
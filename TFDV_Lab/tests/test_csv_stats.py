@@ -0,0 +1,119 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from csv_stats import ColumnStats, QuantileSketch, byte_ranges, profile_csv
+
+
+@pytest.fixture
+def weather_csv(tmp_path):
+    """Small Jena-like CSV: a timestamp column, floats with gaps and an integer column"""
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame({
+        "Date Time": pd.date_range("2009-01-01", periods=n, freq="10min").strftime("%d.%m.%Y %H:%M:%S"),
+        "p (mbar)": rng.normal(989, 8, n).round(2),
+        "T (degC)": rng.normal(9, 8, n).round(2),
+        "wd (deg)": rng.integers(0, 360, n),
+    })
+    df.loc[rng.choice(n, 50, replace=False), "T (degC)"] = np.nan
+    df.loc[[10, 20], "p (mbar)"] = -9999.0
+    path = tmp_path / "jena.csv"
+    df.to_csv(path, index=False)
+    return str(path), df
+
+
+def test_byte_ranges_cover_every_row(weather_csv):
+    """Test chunks split on line boundaries and cover the file"""
+    path, df = weather_csv
+    header, ranges = byte_ranges(path, chunk_bytes=10_000)
+    assert header.startswith("Date Time,")
+    assert len(ranges) > 10
+    assert ranges[-1][1] == os.path.getsize(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    assert all(data[end - 1:end] == b"\n" for _, end in ranges)
+    assert sum(data[s:e].count(b"\n") for s, e in ranges) == len(df)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_matches_pandas_describe(weather_csv, workers):
+    """Test merged chunk statistics match describe() on the whole file"""
+    path, df = weather_csv
+    artifact = profile_csv(path, chunk_bytes=10_000, workers=workers)
+    expected = df.describe()
+
+    assert artifact["num_rows"] == len(df)
+    assert set(artifact["features"]) == {"p (mbar)", "T (degC)", "wd (deg)"}
+    for column, stats in artifact["features"].items():
+        assert stats["count"] == expected[column]["count"]
+        assert stats["min"] == expected[column]["min"]
+        assert stats["max"] == expected[column]["max"]
+        assert stats["mean"] == pytest.approx(expected[column]["mean"], rel=1e-9)
+        assert stats["std"] == pytest.approx(expected[column]["std"], rel=1e-9)
+        assert stats["quantiles"]["0.5"] == pytest.approx(expected[column]["50%"], abs=0.02 * expected[column]["std"])
+        assert sum(stats["histogram"]["counts"]) == pytest.approx(stats["count"], abs=len(stats["histogram"]["counts"]))
+
+    assert artifact["features"]["T (degC)"]["missing"] == 50
+
+
+def test_infers_schema(weather_csv):
+    """Test types, presence and domain in the schema"""
+    path, _ = weather_csv
+    schema = profile_csv(path, workers=1)["schema"]
+
+    assert schema["wd (deg)"]["type"] == "INT"
+    assert schema["T (degC)"]["type"] == "FLOAT"
+    assert schema["p (mbar)"]["presence"]["required"]
+    assert not schema["T (degC)"]["presence"]["required"]
+    assert schema["T (degC)"]["presence"]["min_fraction"] == pytest.approx(0.99)
+    assert schema["p (mbar)"]["domain"]["min"] == -9999.0
+
+
+def test_selected_columns(weather_csv):
+    """Test profiling a subset and rejecting unknown columns"""
+    path, _ = weather_csv
+    assert list(profile_csv(path, columns=["wd (deg)"], workers=1)["features"]) == ["wd (deg)"]
+    with pytest.raises(ValueError):
+        profile_csv(path, columns=["nope"], workers=1)
+
+
+def test_column_stats_merge_is_order_independent():
+    """Test merging partial summaries equals summarizing everything at once"""
+    rng = np.random.default_rng(1)
+    values = rng.exponential(3.0, 10_000)
+    values[::97] = np.nan
+
+    whole = ColumnStats()
+    whole.update(values)
+    merged = ColumnStats()
+    for part in np.array_split(values, 7)[::-1]:
+        stats = ColumnStats()
+        stats.update(part)
+        merged.merge(stats)
+
+    assert merged.count == whole.count
+    assert merged.missing == whole.missing
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.std == pytest.approx(whole.std)
+
+
+def test_quantile_sketch_accuracy():
+    """Test sketch quantiles stay within ~1% rank error after many merges"""
+    rng = np.random.default_rng(2)
+    values = rng.normal(0, 1, 100_000)
+    sketch = QuantileSketch(size=256)
+    for part in np.array_split(values, 50):
+        chunk = QuantileSketch(size=256)
+        chunk.update(part)
+        sketch.merge(chunk)
+
+    qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+    estimated = np.array(sketch.quantiles(qs))
+    ranks = np.searchsorted(np.sort(values), estimated) / len(values)
+    np.testing.assert_allclose(ranks, qs, atol=0.01)
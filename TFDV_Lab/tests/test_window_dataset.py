@@ -0,0 +1,98 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from window_dataset import WindowDataset, prefetch_batches, save_window_dataset
+from windowing import create_time_windows
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(rng.random((300, 5)), columns=[f"f{i}" for i in range(5)])
+
+
+@pytest.fixture
+def dataset(tmp_path, series):
+    return save_window_dataset(str(tmp_path / "train"), series, history_steps=24, forecast_steps=6, stride=2)
+
+
+def test_saves_only_the_series(tmp_path, series, dataset):
+    """Test the files hold the float32 series, not the materialized windows"""
+    saved = np.load(tmp_path / "train" / "series.npy")
+    assert saved.dtype == np.float32
+    assert saved.shape == series.shape
+    assert dataset.params["columns"] == list(series.columns)
+
+
+def test_windows_match_create_time_windows(tmp_path, series):
+    """Test reopened windows equal the in-memory windows"""
+    save_window_dataset(str(tmp_path / "train"), series, 24, 6, 2)
+    dataset = WindowDataset(str(tmp_path / "train"))
+    X, y = create_time_windows(series, 24, 6, 2)
+
+    assert isinstance(dataset.series, np.memmap)
+    assert np.shares_memory(dataset.X, dataset.series)
+    assert len(dataset) == len(X)
+    assert dataset.window_shape == (24, 5)
+    np.testing.assert_array_equal(dataset.X, X)
+    np.testing.assert_array_equal(dataset.y, y)
+
+
+def test_batches_cover_every_window_once(dataset):
+    """Test shuffled batches return every window exactly once"""
+    X_parts, y_parts = [], []
+    for X_batch, y_batch in dataset.batches(batch_size=16, seed=0):
+        assert len(X_batch) <= 16
+        X_parts.append(X_batch)
+        y_parts.append(y_batch)
+
+    X = np.concatenate(X_parts)
+    y = np.concatenate(y_parts)
+    order = np.lexsort(X[:, 0, :].T)
+    expected = np.lexsort(dataset.X[:, 0, :].T)
+    np.testing.assert_array_equal(X[order], dataset.X[expected])
+    np.testing.assert_array_equal(y[order], dataset.y[expected])
+
+
+def test_batches_shuffle_and_drop_last(dataset):
+    """Test seeded shuffling is reproducible and drop_last trims the tail"""
+    first = [y for _, y in dataset.batches(batch_size=10, seed=1)]
+    again = [y for _, y in dataset.batches(batch_size=10, seed=1)]
+    ordered = [y for _, y in dataset.batches(batch_size=10, shuffle=False)]
+
+    np.testing.assert_array_equal(np.concatenate(first), np.concatenate(again))
+    np.testing.assert_array_equal(np.concatenate(ordered), dataset.y)
+    assert not np.array_equal(np.concatenate(first), dataset.y)
+
+    trimmed = list(dataset.batches(batch_size=10, drop_last=True))
+    assert len(trimmed) == len(dataset) // 10
+    assert all(len(X) == 10 for X, _ in trimmed)
+
+
+def test_prefetch_yields_same_batches(dataset):
+    """Test background prefetching does not change the batches"""
+    plain = list(dataset.batches(batch_size=8, seed=3))
+    prefetched = list(dataset.batches(batch_size=8, seed=3, prefetch=2))
+
+    assert len(plain) == len(prefetched)
+    for (X_a, y_a), (X_b, y_b) in zip(plain, prefetched):
+        np.testing.assert_array_equal(X_a, X_b)
+        np.testing.assert_array_equal(y_a, y_b)
+
+
+def test_prefetch_reraises_errors():
+    """Test errors in the producer reach the consumer"""
+    def failing():
+        yield 1
+        raise RuntimeError("broken batch")
+
+    batches = prefetch_batches(failing())
+    assert next(batches) == 1
+    with pytest.raises(RuntimeError, match="broken batch"):
+        next(batches)
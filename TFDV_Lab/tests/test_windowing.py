@@ -0,0 +1,85 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from windowing import count_windows, create_time_windows
+
+
+def loop_time_windows(data, history_steps=24, forecast_steps=6, stride=1):
+    """The original create_time_windows loop from TFDV_Lab1.ipynb (Step 7)"""
+    X, y = [], []
+    total_window_size = history_steps + forecast_steps
+    for i in range(0, len(data) - total_window_size + 1, stride):
+        X.append(data.iloc[i:i+history_steps].values)
+        future_idx = i + history_steps + forecast_steps - 1
+        y.append(data.iloc[future_idx, 0])
+    return np.array(X), np.array(y)
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(rng.random((500, 7)), columns=[f"f{i}" for i in range(7)])
+
+
+@pytest.mark.parametrize("history_steps,forecast_steps,stride", [
+    (24, 6, 1),
+    (24, 6, 5),
+    (10, 1, 3),
+    (1, 1, 1),
+    (100, 50, 7),
+])
+def test_matches_loop_output(series, history_steps, forecast_steps, stride):
+    """Test windows and targets match the notebook loop"""
+    X_loop, y_loop = loop_time_windows(series, history_steps, forecast_steps, stride)
+    X, y = create_time_windows(series, history_steps, forecast_steps, stride, dtype=np.float64)
+
+    assert X.shape == X_loop.shape
+    assert y.shape == y_loop.shape
+    np.testing.assert_array_equal(X, X_loop)
+    np.testing.assert_array_equal(y, y_loop)
+    assert len(X) == count_windows(len(series), history_steps, forecast_steps, stride)
+
+
+def test_float32_matches_loop_within_precision(series):
+    """Test the default float32 windows match the float64 loop to float32 precision"""
+    X_loop, y_loop = loop_time_windows(series)
+    X, y = create_time_windows(series)
+
+    assert X.dtype == np.float32
+    np.testing.assert_allclose(X, X_loop, rtol=1e-6)
+    np.testing.assert_allclose(y, y_loop, rtol=1e-6)
+
+
+def test_windows_are_views(series):
+    """Test X and y share memory with one base array instead of copying"""
+    X, y = create_time_windows(series)
+
+    assert np.shares_memory(X, y)
+    assert not X.flags.writeable
+    assert X.base is not None
+
+
+def test_target_column(series):
+    """Test predicting another column"""
+    X, y = create_time_windows(series.to_numpy(), 24, 6, target_col=3, dtype=np.float64)
+    np.testing.assert_array_equal(y, series.iloc[29:, 3].to_numpy())
+
+
+def test_series_shorter_than_window(series):
+    """Test too short series give empty arrays with the right shape"""
+    X, y = create_time_windows(series.iloc[:29], 24, 6)
+    assert X.shape == (0, 24, 7)
+    assert y.shape == (0,)
+    assert len(loop_time_windows(series.iloc[:29], 24, 6)[0]) == 0
+
+
+def test_invalid_parameters(series):
+    """Test non-positive window parameters are rejected"""
+    with pytest.raises(ValueError):
+        create_time_windows(series, stride=0)
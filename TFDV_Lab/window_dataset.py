@@ -0,0 +1,144 @@
+import json
+import os
+import queue
+import threading
+
+import numpy as np
+
+from windowing import create_time_windows, to_series_array
+
+SERIES_FILE = "series.npy"
+PARAMS_FILE = "windows.json"
+
+
+def save_window_dataset(path, data, history_steps=24, forecast_steps=6, stride=1, target_col=0):
+    """
+    Save a windowed dataset as its base series plus window parameters.
+
+    Only the normalized (samples x features) series is written, as float32,
+    so the files stay the size of the raw data instead of ~history_steps
+    times larger like a materialized X.npy.
+
+    Args:
+        path (str): Directory to write series.npy and windows.json into.
+        data (pandas.DataFrame or numpy.ndarray): Normalized series.
+        history_steps (int): Number of past timesteps (sequence length).
+        forecast_steps (int): Steps ahead to predict.
+        stride (int): Step size between consecutive windows.
+        target_col (int): Column whose future value is the target.
+    Returns:
+        WindowDataset: The saved dataset, opened memory-mapped.
+    """
+    series = to_series_array(data)
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, SERIES_FILE), series)
+    params = {
+        "history_steps": history_steps,
+        "forecast_steps": forecast_steps,
+        "stride": stride,
+        "target_col": target_col,
+        "columns": [str(c) for c in data.columns] if hasattr(data, "columns") else None,
+    }
+    with open(os.path.join(path, PARAMS_FILE), "w") as f:
+        json.dump(params, f, indent=2)
+    return WindowDataset(path)
+
+
+class WindowDataset:
+    """
+    Windows generated on demand from a memory-mapped series.
+
+    X and y are strided views over the mapped file, so opening a dataset
+    reads nothing; pages are loaded only for the windows a batch touches.
+    """
+
+    def __init__(self, path, mmap_mode="r"):
+        with open(os.path.join(path, PARAMS_FILE)) as f:
+            self.params = json.load(f)
+        self.series = np.load(os.path.join(path, SERIES_FILE), mmap_mode=mmap_mode)
+        self.X, self.y = create_time_windows(
+            self.series,
+            self.params["history_steps"],
+            self.params["forecast_steps"],
+            self.params["stride"],
+            self.params["target_col"],
+        )
+
+    def __len__(self):
+        return len(self.X)
+
+    @property
+    def window_shape(self):
+        return self.X.shape[1:]
+
+    def batches(self, batch_size=32, shuffle=True, seed=None, drop_last=False, prefetch=0):
+        """
+        Yield (X_batch, y_batch) mini-batches, copying only one batch at a time.
+        Args:
+            batch_size (int): Windows per batch.
+            shuffle (bool): Shuffle window order each time the generator is created.
+            seed (int): Seed for the shuffle.
+            drop_last (bool): Skip the final batch if it is smaller than batch_size.
+            prefetch (int): Batches to prepare ahead on a background thread (0 disables).
+        Returns:
+            generator: Yields float32 arrays of shape (batch, history_steps, n_features) and (batch,).
+        """
+        generator = self._batches(batch_size, shuffle, seed, drop_last)
+        if prefetch > 0:
+            return prefetch_batches(generator, prefetch)
+        return generator
+
+    def _batches(self, batch_size, shuffle, seed, drop_last):
+        order = np.arange(len(self))
+        if shuffle:
+            np.random.default_rng(seed).shuffle(order)
+        stop = len(order) - len(order) % batch_size if drop_last else len(order)
+        for start in range(0, stop, batch_size):
+            # Sorting within a batch keeps its content but reads the file in order
+            idx = np.sort(order[start:start + batch_size])
+            yield self.X[idx], self.y[idx]
+
+
+_DONE = object()
+
+
+def prefetch_batches(generator, size=2):
+    """
+    Run a batch generator on a background thread, keeping up to `size` batches ready.
+    Exceptions raised by the generator are re-raised in the consumer.
+    """
+    buffer = queue.Queue(maxsize=size)
+    stopped = threading.Event()
+
+    def put(item):
+        # Give up once the consumer is gone, so the thread never blocks forever
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def producer():
+        try:
+            for batch in generator:
+                if not put(batch):
+                    return
+            put(_DONE)
+        except Exception as e:
+            put(e)
+
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+    try:
+        while True:
+            batch = buffer.get()
+            if batch is _DONE:
+                return
+            if isinstance(batch, Exception):
+                raise batch
+            yield batch
+    finally:
+        # Consumer stopped early (break or error): let the producer exit
+        stopped.set()
@@ -0,0 +1,69 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def to_series_array(data, dtype=np.float32):
+    """
+    Convert a dataframe or array to one contiguous (samples, features) array.
+    Args:
+        data (pandas.DataFrame or numpy.ndarray): Normalized series.
+        dtype (numpy.dtype): Output dtype, float32 by default.
+    Returns:
+        numpy.ndarray: C-contiguous 2D array (no copy if it already is one).
+    """
+    values = data.to_numpy() if hasattr(data, "to_numpy") else data
+    values = np.ascontiguousarray(values, dtype=dtype)
+    if values.ndim == 1:
+        values = values[:, None]
+    return values
+
+
+def count_windows(n_samples, history_steps=24, forecast_steps=6, stride=1):
+    """Number of windows create_time_windows() yields for a series of n_samples."""
+    total_window_size = history_steps + forecast_steps
+    if n_samples < total_window_size:
+        return 0
+    return (n_samples - total_window_size) // stride + 1
+
+
+def create_time_windows(data, history_steps=24, forecast_steps=6, stride=1,
+                        target_col=0, dtype=np.float32):
+    """
+    Create sliding windows for time series prediction (LSTM input) without copying.
+
+    Produces the same windows as the loop in TFDV_Lab1.ipynb, but X is a
+    read-only strided view over one contiguous array instead of a stack of
+    per-window copies, so memory stays at the size of the input series.
+
+    Args:
+        data (pandas.DataFrame or numpy.ndarray): Normalized series (samples x features).
+        history_steps (int): Number of past timesteps (sequence length).
+        forecast_steps (int): Horizon, i.e. steps ahead of the window to predict.
+        stride (int): Step size between consecutive windows.
+        target_col (int): Column whose future value is the target.
+        dtype (numpy.dtype): dtype of the underlying array, float32 by default.
+    Returns:
+        X (numpy.ndarray): Windows of features (n_windows, history_steps, n_features), a view.
+        y (numpy.ndarray): Target values (n_windows,), a view.
+    """
+    if history_steps < 1 or forecast_steps < 1 or stride < 1:
+        raise ValueError("history_steps, forecast_steps and stride must be >= 1")
+
+    values = to_series_array(data, dtype)
+    n_windows = count_windows(len(values), history_steps, forecast_steps, stride)
+    if n_windows == 0:
+        return (np.empty((0, history_steps, values.shape[1]), dtype=values.dtype),
+                np.empty((0,), dtype=values.dtype))
+
+    # Windows start at i = 0, stride, 2*stride, ...; the history must leave room for the horizon
+    history = values[:len(values) - forecast_steps]
+    X = sliding_window_view(history, history_steps, axis=0)[::stride].transpose(0, 2, 1)
+    y = values[history_steps + forecast_steps - 1::stride, target_col][:n_windows]
+    return X, y
+
+
+def materialized_nbytes(n_samples, n_features, history_steps=24, forecast_steps=6,
+                        stride=1, itemsize=8):
+    """Bytes a fully copied (n_windows, history_steps, n_features) X would take."""
+    n_windows = count_windows(n_samples, history_steps, forecast_steps, stride)
+    return n_windows * history_steps * n_features * itemsize